@@ -0,0 +1,49 @@
+"""Replace per-column audit_logs indexes with composite indexes
+
+Revision ID: 010_audit_log_composite_indexes
+Revises: 009_phase2_otb_range
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '010_audit_log_composite_indexes'
+down_revision: Union[str, None] = '009_phase2_otb_range'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Single-column indexes created by 006_audit_and_fields (user_id is kept for the FK)
+_SINGLE_COLUMN_INDEXES = ('entity_type', 'entity_id', 'action', 'timestamp', 'season_id')
+
+
+def upgrade() -> None:
+    """Create entity/season history indexes and drop the single-column ones."""
+
+    op.create_index(
+        'ix_audit_entity_time',
+        'audit_logs',
+        ['entity_type', 'entity_id', sa.text('timestamp DESC')],
+    )
+    op.create_index(
+        'ix_audit_season_time',
+        'audit_logs',
+        ['season_id', sa.text('timestamp DESC')],
+        postgresql_where=sa.text('season_id IS NOT NULL'),
+    )
+
+    for column in _SINGLE_COLUMN_INDEXES:
+        op.execute(f'DROP INDEX IF EXISTS ix_audit_logs_{column}')
+
+
+def downgrade() -> None:
+    """Restore the single-column indexes."""
+
+    for column in _SINGLE_COLUMN_INDEXES:
+        op.create_index(f'ix_audit_logs_{column}', 'audit_logs', [column])
+
+    op.drop_index('ix_audit_season_time', 'audit_logs')
+    op.drop_index('ix_audit_entity_time', 'audit_logs')
@@ -0,0 +1,51 @@
+"""Composite/covering indexes for OTB and PO query paths
+
+Revision ID: 011_otb_po_composite_indexes
+Revises: 010_audit_log_composite_indexes
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '011_otb_po_composite_indexes'
+down_revision: Union[str, None] = '010_audit_log_composite_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create covering indexes for season-scoped OTB/PO aggregates."""
+
+    op.create_index(
+        'ix_otb_plan_season_cat_month',
+        'otb_plan',
+        ['season_id', 'category_id', 'month'],
+        postgresql_include=['approved_spend_limit'],
+    )
+    op.create_index(
+        'ix_otb_pos_season_cat_month',
+        'otb_positions',
+        ['season_id', 'category_id', 'month'],
+        postgresql_include=['planned_otb', 'consumed_otb', 'available_otb'],
+    )
+    op.create_index(
+        'ix_po_season_cat_loc',
+        'purchase_orders',
+        ['season_id', 'category_id', 'location_id'],
+        postgresql_include=['po_value'],
+    )
+    op.create_index(
+        'ix_otb_adj_season_status_created',
+        'otb_adjustments',
+        ['season_id', 'status', 'created_at'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_otb_adj_season_status_created', 'otb_adjustments')
+    op.drop_index('ix_po_season_cat_loc', 'purchase_orders')
+    op.drop_index('ix_otb_pos_season_cat_month', 'otb_positions')
+    op.drop_index('ix_otb_plan_season_cat_month', 'otb_plan')
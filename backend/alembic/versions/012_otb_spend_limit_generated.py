@@ -0,0 +1,62 @@
+"""Make otb_plan.approved_spend_limit a stored generated column
+
+Revision ID: 012_otb_spend_limit_generated
+Revises: 011_otb_po_composite_indexes
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '012_otb_spend_limit_generated'
+down_revision: Union[str, None] = '011_otb_po_composite_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_OTB_FORMULA = 'planned_sales + planned_closing_stock - opening_stock - on_order'
+
+
+def upgrade() -> None:
+    """Replace the application-written column with a generated one."""
+
+    # PostgreSQL cannot turn an existing column into a generated column, so
+    # drop and re-add it (this also drops the covering index that includes it).
+    op.drop_index('ix_otb_plan_season_cat_month', 'otb_plan')
+    op.drop_column('otb_plan', 'approved_spend_limit')
+    op.add_column(
+        'otb_plan',
+        sa.Column(
+            'approved_spend_limit',
+            sa.Numeric(precision=18, scale=2),
+            sa.Computed(_OTB_FORMULA, persisted=True),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        'ix_otb_plan_season_cat_month',
+        'otb_plan',
+        ['season_id', 'category_id', 'month'],
+        postgresql_include=['approved_spend_limit'],
+    )
+
+
+def downgrade() -> None:
+    """Restore a plain column populated from the formula."""
+
+    op.drop_index('ix_otb_plan_season_cat_month', 'otb_plan')
+    op.drop_column('otb_plan', 'approved_spend_limit')
+    op.add_column(
+        'otb_plan',
+        sa.Column('approved_spend_limit', sa.Numeric(precision=18, scale=2), nullable=True),
+    )
+    op.execute(f'UPDATE otb_plan SET approved_spend_limit = {_OTB_FORMULA}')
+    op.alter_column('otb_plan', 'approved_spend_limit', nullable=False)
+    op.create_index(
+        'ix_otb_plan_season_cat_month',
+        'otb_plan',
+        ['season_id', 'category_id', 'month'],
+        postgresql_include=['approved_spend_limit'],
+    )
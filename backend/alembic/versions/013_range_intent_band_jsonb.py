@@ -0,0 +1,30 @@
+"""Store range_intent.price_band_mix as JSONB
+
+Revision ID: 013_range_intent_band_jsonb
+Revises: 012_otb_spend_limit_generated
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '013_range_intent_band_jsonb'
+down_revision: Union[str, None] = '012_otb_spend_limit_generated'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        'ALTER TABLE range_intent '
+        'ALTER COLUMN price_band_mix TYPE jsonb USING price_band_mix::jsonb'
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        'ALTER TABLE range_intent '
+        'ALTER COLUMN price_band_mix TYPE json USING price_band_mix::json'
+    )
@@ -0,0 +1,34 @@
+"""Database-side zero defaults for OTB amount columns
+
+Revision ID: 014_otb_zero_server_defaults
+Revises: 013_range_intent_band_jsonb
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '014_otb_zero_server_defaults'
+down_revision: Union[str, None] = '013_range_intent_band_jsonb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_ZERO_DEFAULT_COLUMNS = {
+    'otb_plan': ('planned_sales', 'planned_closing_stock', 'opening_stock', 'on_order'),
+    'otb_positions': ('planned_otb', 'consumed_otb', 'available_otb'),
+}
+
+
+def upgrade() -> None:
+    for table, columns in _ZERO_DEFAULT_COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, server_default=sa.text('0'))
+
+
+def downgrade() -> None:
+    for table, columns in _ZERO_DEFAULT_COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, server_default=None)
@@ -0,0 +1,32 @@
+"""Composite index for company-scoped cluster listing
+
+Revision ID: 015_cluster_company_created_idx
+Revises: 014_otb_zero_server_defaults
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '015_cluster_company_created_idx'
+down_revision: Union[str, None] = '014_otb_zero_server_defaults'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the single-column company_id index with (company_id, created_at)."""
+
+    op.create_index(
+        'ix_clusters_company_created',
+        'clusters',
+        ['company_id', 'created_at'],
+    )
+    op.drop_index('ix_clusters_company_id', 'clusters')
+
+
+def downgrade() -> None:
+    op.create_index('ix_clusters_company_id', 'clusters', ['company_id'])
+    op.drop_index('ix_clusters_company_created', 'clusters')
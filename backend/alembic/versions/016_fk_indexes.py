@@ -0,0 +1,28 @@
+"""Index unindexed foreign keys on users and locations
+
+Revision ID: 016_fk_indexes
+Revises: 015_cluster_company_created_idx
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '016_fk_indexes'
+down_revision: Union[str, None] = '015_cluster_company_created_idx'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index users.company_id and locations.cluster_id."""
+
+    op.create_index('ix_users_company_id', 'users', ['company_id'])
+    op.create_index('ix_locations_cluster_id', 'locations', ['cluster_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_locations_cluster_id', 'locations')
+    op.drop_index('ix_users_company_id', 'users')
@@ -0,0 +1,34 @@
+"""Partial index on live user sessions
+
+Revision ID: 017_user_sessions_active_index
+Revises: 016_fk_indexes
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '017_user_sessions_active_index'
+down_revision: Union[str, None] = '016_fk_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index live sessions by user and drop the boolean is_active index."""
+
+    op.create_index(
+        'ix_user_sessions_active',
+        'user_sessions',
+        ['user_id'],
+        postgresql_where=sa.text('is_active AND revoked_at IS NULL'),
+    )
+    op.execute('DROP INDEX IF EXISTS ix_user_sessions_is_active')
+
+
+def downgrade() -> None:
+    op.create_index('ix_user_sessions_is_active', 'user_sessions', ['is_active'])
+    op.drop_index('ix_user_sessions_active', 'user_sessions')
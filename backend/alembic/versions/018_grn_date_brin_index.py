@@ -0,0 +1,32 @@
+"""BRIN index on grn_records.grn_date
+
+Revision ID: 018_grn_date_brin_index
+Revises: 017_user_sessions_active_index
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '018_grn_date_brin_index'
+down_revision: Union[str, None] = '017_user_sessions_active_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create a BRIN index for GRN date-range scans."""
+
+    op.create_index(
+        'ix_grn_grn_date_brin',
+        'grn_records',
+        ['grn_date'],
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_grn_grn_date_brin', 'grn_records')
@@ -0,0 +1,32 @@
+"""Covering expression index for monthly GRN summaries
+
+Revision ID: 019_grn_month_index
+Revises: 018_grn_date_brin_index
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '019_grn_month_index'
+down_revision: Union[str, None] = '018_grn_date_brin_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index the month of grn_date, carrying received_value for index-only scans."""
+
+    op.create_index(
+        'ix_grn_month',
+        'grn_records',
+        [sa.text("date_trunc('month', CAST(grn_date AS TIMESTAMP WITHOUT TIME ZONE))")],
+        postgresql_include=['received_value'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_grn_month', 'grn_records')
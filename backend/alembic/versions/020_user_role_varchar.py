@@ -0,0 +1,39 @@
+"""Store users.role as VARCHAR with a CHECK constraint
+
+Revision ID: 020_user_role_varchar
+Revises: 019_grn_month_index
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '020_user_role_varchar'
+down_revision: Union[str, None] = '019_grn_month_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert the native user_role enum to VARCHAR(20) + CHECK."""
+
+    # The enum-typed default cannot be cast along with the column.
+    op.execute("ALTER TABLE users ALTER COLUMN role DROP DEFAULT")
+    op.execute("ALTER TABLE users ALTER COLUMN role TYPE VARCHAR(20) USING role::text")
+    op.execute("ALTER TABLE users ALTER COLUMN role SET DEFAULT 'viewer'")
+    op.create_check_constraint(
+        'user_role_check',
+        'users',
+        "role IN ('super_admin', 'admin', 'manager', 'viewer')",
+    )
+    op.execute('DROP TYPE IF EXISTS user_role')
+
+
+def downgrade() -> None:
+    op.drop_constraint('user_role_check', 'users', type_='check')
+    op.execute("CREATE TYPE user_role AS ENUM ('admin', 'manager', 'viewer', 'super_admin')")
+    op.execute("ALTER TABLE users ALTER COLUMN role DROP DEFAULT")
+    op.execute("ALTER TABLE users ALTER COLUMN role TYPE user_role USING role::user_role")
+    op.execute("ALTER TABLE users ALTER COLUMN role SET DEFAULT 'viewer'")
@@ -0,0 +1,46 @@
+"""Unique index for uncategorised OTB positions
+
+Revision ID: 021_otb_pos_null_cat_unique
+Revises: 020_user_role_varchar
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '021_otb_pos_null_cat_unique'
+down_revision: Union[str, None] = '020_user_role_varchar'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Give NULL-category positions an ON CONFLICT target."""
+
+    # Keep the most recently calculated row of any duplicates the old
+    # select-then-insert upsert may have left behind.
+    op.execute(
+        """
+        DELETE FROM otb_positions p
+        USING otb_positions q
+        WHERE p.category_id IS NULL
+          AND q.category_id IS NULL
+          AND p.season_id = q.season_id
+          AND p.month = q.month
+          AND (p.updated_at, p.id) < (q.updated_at, q.id)
+        """
+    )
+    op.create_index(
+        'uq_otb_position_season_month_no_category',
+        'otb_positions',
+        ['season_id', 'month'],
+        unique=True,
+        postgresql_where=sa.text('category_id IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_otb_position_season_month_no_category', 'otb_positions')
@@ -6,8 +6,8 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.core.deps import get_current_user, require_super_admin
+from app.core.deps import get_current_user, get_db_session, require_super_admin
+from app.core.user_cache import invalidate_cached_user
 from app.models.user import User, UserRole
 from app.models.company import CompanyStatus
 from app.repositories.company_repo import CompanyRepository
@@ -38,7 +38,7 @@ async def list_companies(
     status: Optional[CompanyStatus] = Query(None, description="Filter by status"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_session),
     current_user: User = Depends(require_super_admin),
 ):
     """List all companies with optional status filter."""
@@ -61,7 +61,7 @@ async def list_companies(
 async def list_pending_companies(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_session),
     current_user: User = Depends(require_super_admin),
 ):
     """List pending company registration requests."""
@@ -79,7 +79,7 @@ async def list_pending_companies(
 )
 async def get_company(
     company_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_session),
     current_user: User = Depends(require_super_admin),
 ):
     """Get company by ID."""
@@ -103,7 +103,7 @@ async def get_company(
 )
 async def approve_company(
     company_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_session),
     current_user: User = Depends(require_super_admin),
 ):
     """Approve a pending company request and activate the admin user."""
@@ -120,14 +120,14 @@ async def approve_company(
         )
     
     # Activate all users belonging to this company
-    company_users = await user_repo.list_by_company(str(company_id))
+    company_users = await user_repo.list_by_company(company_id)
     for user in company_users:
         if not user.is_active:
             user.is_active = True
             user.company_code = company.code  # Set the generated code
+            invalidate_cached_user(db, user.id)
     
     await db.commit()
-    await db.refresh(company)
     
     return company
 
@@ -141,7 +141,7 @@ async def approve_company(
 async def reject_company(
     company_id: UUID,
     data: CompanyApproval,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_session),
     current_user: User = Depends(require_super_admin),
 ):
     """Reject a pending company request."""
@@ -171,7 +171,7 @@ async def reject_company(
 )
 async def suspend_company(
     company_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_session),
     current_user: User = Depends(require_super_admin),
 ):
     """Suspend an approved company."""
@@ -195,7 +195,7 @@ async def suspend_company(
 )
 async def reactivate_company(
     company_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_session),
     current_user: User = Depends(require_super_admin),
 ):
     """Reactivate a suspended company."""
@@ -225,7 +225,7 @@ async def list_all_users(
     role: Optional[UserRole] = Query(None, description="Filter by role"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_session),
     current_user: User = Depends(require_super_admin),
 ):
     """List all users with filters."""
@@ -248,7 +248,7 @@ async def list_all_users(
 )
 async def make_user_admin(
     user_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_session),
     current_user: User = Depends(require_super_admin),
 ):
     """Promote user to admin."""
@@ -267,7 +267,8 @@ async def make_user_admin(
             detail="Cannot modify super admin role",
         )
     
-    await repo.update(user_id, {"role": UserRole.ADMIN})
+    await repo.update(user_id, role=UserRole.ADMIN)
+    invalidate_cached_user(db, user_id)
     
     return MessageResponse(message=f"User {user.name} is now a company admin")
 
@@ -280,7 +281,7 @@ async def make_user_admin(
 )
 async def deactivate_user(
     user_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_session),
     current_user: User = Depends(require_super_admin),
 ):
     """Deactivate a user."""
@@ -299,7 +300,8 @@ async def deactivate_user(
             detail="Cannot deactivate super admin",
         )
     
-    await repo.update(user_id, {"is_active": False})
+    await repo.update(user_id, is_active=False)
+    invalidate_cached_user(db, user_id)
     
     return MessageResponse(message=f"User {user.name} has been deactivated")
 
@@ -312,7 +314,7 @@ async def deactivate_user(
 )
 async def activate_user(
     user_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_session),
     current_user: User = Depends(require_super_admin),
 ):
     """Activate a user."""
@@ -325,7 +327,8 @@ async def activate_user(
             detail="User not found",
         )
     
-    await repo.update(user_id, {"is_active": True})
+    await repo.update(user_id, is_active=True)
+    invalidate_cached_user(db, user_id)
     
     return MessageResponse(message=f"User {user.name} has been activated")
 
@@ -340,7 +343,7 @@ async def activate_user(
     description="Get overall system statistics for the admin dashboard.",
 )
 async def get_system_stats(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_session),
     current_user: User = Depends(require_super_admin),
 ):
     """Get system-wide statistics."""
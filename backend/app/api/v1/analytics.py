@@ -5,12 +5,18 @@ These endpoints provide analytics and reporting for seasons.
 Available for all seasons, but LOCKED seasons are fully read-only.
 """
 
+from collections import defaultdict
+from collections.abc import AsyncIterator
 from typing import Optional
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
+from app.core.database import async_session_factory
 from app.core.deps import DBSession
+from app.repositories.po_repo import PurchaseOrderRepository
 from app.services.analytics_service import AnalyticsService
 from app.services.workflow_orchestrator import WorkflowOrchestrator
 from app.services.plan_service import SeasonPlanService
@@ -177,12 +183,16 @@ async def get_complete_season_view(
             "records": [PurchaseOrderResponse.model_validate(po).model_dump() for po in pos],
         }
         
-        # Get all GRN records for this season's POs
+        # GRN records for this season's POs in one query (up to `limit` per PO),
+        # grouped in PO order
         grn_service = GRNIngestService(db)
-        all_grns = []
-        for po in pos:
-            grns, _ = await grn_service.get_grn_records_by_po(po.id, 0, limit)
-            all_grns.extend(grns)
+        grns_by_po: dict[UUID, list] = defaultdict(list)
+        po_grns = await grn_service.get_grn_records_by_pos(
+            [po.id for po in pos], limit_per_po=limit,
+        )
+        for grn in po_grns:
+            grns_by_po[grn.po_id].append(grn)
+        all_grns = [grn for po in pos for grn in grns_by_po[po.id]]
         result["grn_records"] = {
             "total": len(all_grns),
             "records": [GRNRecordResponse.model_validate(g).model_dump() for g in all_grns],
@@ -401,6 +411,36 @@ async def export_season_data(
     return await service.export_season_data(season_id, format)
 
 
+async def _po_export_lines(season_id: UUID) -> AsyncIterator[bytes]:
+    """Yield one NDJSON chunk per batch of streamed purchase orders."""
+    # The request session is closed before the body is sent, so the
+    # stream owns its own session for the lifetime of the cursor.
+    async with async_session_factory() as session:
+        async for rows in PurchaseOrderRepository(session).stream_by_season(season_id):
+            yield b"".join(
+                orjson.dumps(row._asdict(), default=str, option=orjson.OPT_APPEND_NEWLINE)
+                for row in rows
+            )
+
+
+@router.get(
+    "/export/{season_id}/purchase-orders",
+    summary="Stream season purchase orders",
+    response_class=StreamingResponse,
+)
+async def export_season_purchase_orders(season_id: UUID) -> StreamingResponse:
+    """
+    Export every purchase order of a season as newline-delimited JSON.
+    
+    Rows are streamed from a server-side cursor, so large seasons are
+    never held in memory at once.
+    """
+    return StreamingResponse(
+        _po_export_lines(season_id),
+        media_type="application/x-ndjson",
+    )
+
+
 @router.get(
     "/plan-vs-execution/{season_id}",
     summary="Get plan vs execution analysis",
@@ -15,8 +15,10 @@ from app.core.security import (
     create_password_reset_token,
     create_refresh_token,
     generate_company_code,
-    hash_password,
+    hash_password_async,
+    verify_access_token,
     verify_email_verification_token,
+    verify_password_async,
     verify_password_reset_token,
     verify_refresh_token,
 )
@@ -149,7 +151,7 @@ async def register_company(
         email=data.email,
         password=data.password,
         role=UserRole.ADMIN,
-        company_id=str(company.id),
+        company_id=company.id,
         company_name=data.company_name,
         is_active=False,  # Cannot login until approved
     )
@@ -220,7 +222,7 @@ async def join_company(
         email=data.email,
         password=data.password,
         role=UserRole.VIEWER,
-        company_id=str(company.id),
+        company_id=company.id,
         company_name=company.name,
         company_code=company.code,
         is_active=True,
@@ -230,7 +232,7 @@ async def join_company(
     tokens = _create_tokens(user.id)
     
     # Store refresh token hash
-    await user_repo.set_refresh_token(user.id, hash_password(tokens.refresh_token))
+    await user_repo.set_refresh_token(user.id, await hash_password_async(tokens.refresh_token))
     
     # Update last login
     await user_repo.update_last_login(user.id)
@@ -377,7 +379,7 @@ async def register(
     )
     
     tokens = _create_tokens(user.id)
-    await repo.set_refresh_token(user.id, hash_password(tokens.refresh_token))
+    await repo.set_refresh_token(user.id, await hash_password_async(tokens.refresh_token))
     await repo.update_last_login(user.id)
     
     return AuthResponse(
@@ -485,7 +487,7 @@ async def login(
     tokens = _create_tokens(user.id)
     
     # Store refresh token hash
-    await repo.set_refresh_token(user.id, hash_password(tokens.refresh_token))
+    await repo.set_refresh_token(user.id, await hash_password_async(tokens.refresh_token))
     
     # Update last login
     await repo.update_last_login(user.id)
@@ -532,7 +534,7 @@ async def refresh_token(
     tokens = _create_tokens(user.id)
     
     # Update refresh token hash
-    await repo.set_refresh_token(user.id, hash_password(tokens.refresh_token))
+    await repo.set_refresh_token(user.id, await hash_password_async(tokens.refresh_token))
     
     return tokens
 
@@ -553,8 +555,6 @@ async def logout(
     if credentials is None:
         return MessageResponse(message="Logged out successfully")
     
-    from app.core.security import verify_access_token
-    
     user_id = verify_access_token(credentials.credentials)
     if user_id:
         repo = UserRepository(db)
@@ -654,8 +654,6 @@ async def change_password(
     """
     Change password for the authenticated user.
     """
-    from app.core.security import verify_access_token, verify_password
-    
     user_id = verify_access_token(credentials.credentials)
     if user_id is None:
         raise HTTPException(
@@ -674,7 +672,7 @@ async def change_password(
         )
     
     # Verify current password
-    if not verify_password(data.current_password, user.password_hash):
+    if not await verify_password_async(data.current_password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect",
@@ -702,8 +700,6 @@ async def get_current_user(
     """
     Get the current authenticated user's profile.
     """
-    from app.core.security import verify_access_token
-    
     if credentials is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -216,6 +216,11 @@ async def delete_category(
 ) -> None:
     """Delete a category and its children."""
     repo = CategoryRepository(db)
+    if await repo.is_in_use(category_id):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Category or one of its subcategories is used by plans or purchase orders",
+        )
     deleted = await repo.delete(category_id)
     
     if not deleted:
@@ -381,6 +381,12 @@ async def delete_location(
             detail="Access denied to this location",
         )
     
+    if await repo.is_in_use(location_id):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Location is used by season plans, OTB plans or purchase orders",
+        )
+    
     # Capture old data for audit
     old_data = {
         "id": str(existing.id),
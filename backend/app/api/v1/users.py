@@ -6,6 +6,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.core.deps import DBSession
+from app.core.user_cache import invalidate_cached_user
 from app.models.user import UserRole
 from app.repositories.user_repo import UserRepository
 from app.schemas.user import (
@@ -107,6 +108,7 @@ async def update_user(
     
     update_data = data.model_dump(exclude_unset=True)
     user = await repo.update(user_id, **update_data)
+    invalidate_cached_user(db, user_id)
     
     if not user:
         raise HTTPException(
@@ -129,6 +131,7 @@ async def delete_user(
     """Delete a user."""
     repo = UserRepository(db)
     deleted = await repo.delete(user_id)
+    invalidate_cached_user(db, user_id)
     
     if not deleted:
         raise HTTPException(
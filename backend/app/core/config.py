@@ -29,13 +29,25 @@ class Settings(BaseSettings):
     DB_POOL_SIZE: int = 10
     DB_MAX_OVERFLOW: int = 20
     DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_STATEMENT_CACHE_SIZE: int = 1024
+    # SQLAlchemy compiled-SQL cache entries per engine
+    DB_QUERY_CACHE_SIZE: int = 1200
+    # Adaptive pool sizing - overflow grows up to DB_MAX_OVERFLOW_LIMIT under load
+    DB_MAX_OVERFLOW_LIMIT: int = 50
+    DB_POOL_RESIZE_STEP: int = 5
+    DB_POOL_MONITOR_INTERVAL_SECONDS: int = 5
     DB_ECHO: bool = False
+    # Run Base.metadata.create_all in every worker at startup (dev only; see app.utils.init_db)
+    AUTO_CREATE_TABLES: bool = False
     
     # CORS - accepts comma-separated string from env or JSON list
     CORS_ORIGINS: str = "http://localhost:3000,http://localhost:8080"
     CORS_ALLOW_CREDENTIALS: bool = True
-    CORS_ALLOW_METHODS: List[str] = ["*"]
-    CORS_ALLOW_HEADERS: List[str] = ["*"]
+    # Explicit lists (not "*") let preflights be answered without echoing request headers
+    CORS_ALLOW_METHODS: List[str] = ["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"]
+    CORS_ALLOW_HEADERS: List[str] = ["Authorization", "Content-Type", "X-Request-ID"]
+    CORS_MAX_AGE: int = 86400
     
     # Security & JWT
     SECRET_KEY: str = "your-super-secret-key-change-in-production"
@@ -44,6 +56,9 @@ class Settings(BaseSettings):
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     PASSWORD_RESET_EXPIRE_HOURS: int = 1
     
+    # Health checks - interval of the background database probe
+    HEALTH_CHECK_INTERVAL_SECONDS: int = 5
+    
     # Rate Limiting
     RATE_LIMIT_REQUESTS: int = 100
     RATE_LIMIT_WINDOW_SECONDS: int = 60
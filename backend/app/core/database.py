@@ -1,43 +1,78 @@
 """Database engine and session management."""
 
-from typing import AsyncGenerator
+from typing import Awaitable, Callable, TypeVar
 
+import orjson
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.pool import NullPool
+from sqlalchemy.orm import ORMExecuteState, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
-from sqlalchemy import func as sa_func, text
+from sqlalchemy import TIMESTAMP, cast, func as sa_func, text
 
 from app.core.config import settings
 
+T = TypeVar("T")
+
 # Check if using SQLite (for testing) or PostgreSQL
 is_sqlite = settings.DATABASE_URL.startswith("sqlite")
 
 
 def month_trunc(column):
-    """Cross-DB month truncation: strftime for SQLite, date_trunc for PostgreSQL."""
+    """Cross-DB month truncation: strftime for SQLite, date_trunc for PostgreSQL.
+
+    The PostgreSQL form casts to ``timestamp`` so it stays IMMUTABLE and matches
+    the ``ix_grn_month`` expression index.
+    """
     if is_sqlite:
         return sa_func.strftime("%Y-%m-01", column)
-    return sa_func.date_trunc(text("'month'"), column)
+    return sa_func.date_trunc(text("'month'"), cast(column, TIMESTAMP))
+
+
+def _json_serializer(value) -> str:
+    """Serialize JSON/JSONB column values with orjson."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 # Create async engine with appropriate settings
 if is_sqlite:
     engine = create_async_engine(
         settings.DATABASE_URL,
         echo=settings.DB_ECHO,
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE,
         connect_args={"check_same_thread": False},
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
     )
+    
+    @event.listens_for(engine.sync_engine, "connect")
+    def _enable_sqlite_foreign_keys(dbapi_connection, connection_record) -> None:
+        """SQLite ignores ON DELETE rules unless foreign keys are switched on."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
 else:
     engine = create_async_engine(
         settings.DATABASE_URL,
         echo=settings.DB_ECHO,
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+        poolclass=AsyncAdaptedQueuePool,
         pool_size=settings.DB_POOL_SIZE,
         max_overflow=settings.DB_MAX_OVERFLOW,
         pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
         pool_pre_ping=True,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
+        # Reuse prepared statements per connection (SQLAlchemy and asyncpg caches)
+        connect_args={
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        },
     )
 
 # Create session factory
@@ -50,17 +85,42 @@ async_session_factory = async_sessionmaker(
 )
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency that provides a database session."""
+@event.listens_for(Session, "after_flush")
+def _mark_flush_writes(session: Session, flush_context) -> None:
+    """Record that the unit of work wrote to the database."""
+    session.info["has_writes"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement_writes(orm_execute_state: ORMExecuteState) -> None:
+    """Record INSERT/UPDATE/DELETE statements issued via session.execute()."""
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        orm_execute_state.session.info["has_writes"] = True
+
+
+def session_has_writes(session: AsyncSession) -> bool:
+    """Check whether a session has pending or already-issued writes."""
+    return bool(
+        session.new
+        or session.dirty
+        or session.deleted
+        or session.info.get("has_writes")
+    )
+
+
+async def run_in_new_session(fn: Callable[[AsyncSession], Awaitable[T]]) -> T:
+    """Run a read on its own short-lived session.
+
+    Lets an independent read (such as a page's total count) overlap with work
+    on the request session via asyncio.gather. The new session cannot see the
+    caller's uncommitted changes, so only use it for reads.
+    """
     async with async_session_factory() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+        return await fn(session)
 
 
 async def init_db() -> None:
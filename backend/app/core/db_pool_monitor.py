@@ -0,0 +1,135 @@
+"""
+Adaptive connection pool sizing.
+
+A background task samples pool utilisation and in-flight requests and
+raises the pool's overflow allowance before checkouts start queueing, then
+lowers it back to the configured baseline once load drops. Connections
+beyond ``pool_size`` are closed when returned, so a lower allowance frees
+PostgreSQL backends as soon as the burst is over.
+
+QueuePool has no public way to change its overflow allowance, so the
+monitor sets the private ``QueuePool._max_overflow``, which SQLAlchemy 2.0
+and 2.1 read on every checkout (requirements.txt caps SQLAlchemy below 2.2
+for this reason). ``overflow_is_resizable`` checks at startup that this
+still works; if it does not, the pool keeps its configured size.
+"""
+
+import asyncio
+import sqlite3
+from functools import cache
+from typing import Any
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.middleware import RequestLoggingMiddleware
+
+logger = get_logger(__name__)
+
+# Utilisation thresholds (checked-out connections / current capacity)
+SCALE_UP_THRESHOLD = 0.8
+SCALE_DOWN_THRESHOLD = 0.2
+
+
+@cache
+def overflow_is_resizable() -> bool:
+    """
+    Check that changing ``QueuePool._max_overflow`` is honoured at checkout.
+
+    Runs once against a throwaway pool of in-memory SQLite connections with
+    pool_size=1 and max_overflow=0: a second concurrent checkout only
+    succeeds if raising the allowance to 1 took effect.
+    """
+    pool = QueuePool(
+        lambda: sqlite3.connect(":memory:"),
+        pool_size=1,
+        max_overflow=0,
+        timeout=0,
+    )
+    if not hasattr(pool, "_max_overflow"):
+        return False
+    
+    pool._max_overflow = 1
+    first = pool.connect()
+    try:
+        second = pool.connect()
+    except PoolTimeoutError:
+        return False
+    else:
+        second.close()
+        return True
+    finally:
+        first.close()
+        pool.dispose()
+
+
+def _resize(pool: QueuePool) -> None:
+    """Adjust the pool's overflow allowance from the current load."""
+    # QueuePool has no public setter; _max_overflow is read on every checkout
+    max_overflow = pool._max_overflow
+    capacity = pool.size() + max_overflow
+    utilisation = pool.checkedout() / capacity if capacity else 1.0
+    in_flight = RequestLoggingMiddleware.in_flight
+    
+    if (
+        utilisation > SCALE_UP_THRESHOLD or in_flight > capacity
+    ) and max_overflow < settings.DB_MAX_OVERFLOW_LIMIT:
+        new_overflow = min(
+            max_overflow + settings.DB_POOL_RESIZE_STEP,
+            settings.DB_MAX_OVERFLOW_LIMIT,
+        )
+    elif (
+        utilisation < SCALE_DOWN_THRESHOLD
+        and max_overflow > settings.DB_MAX_OVERFLOW
+    ):
+        new_overflow = max(
+            max_overflow - settings.DB_POOL_RESIZE_STEP,
+            settings.DB_MAX_OVERFLOW,
+        )
+    else:
+        return
+    
+    pool._max_overflow = new_overflow
+    logger.info(
+        f"Resized connection pool overflow {max_overflow} -> {new_overflow}",
+        extra={
+            "utilisation": round(utilisation, 2),
+            "in_flight": in_flight,
+            "checked_out": pool.checkedout(),
+        },
+    )
+
+
+def pool_stats(engine: AsyncEngine) -> dict[str, Any]:
+    """Current pool counters for monitoring endpoints."""
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "max_overflow": getattr(pool, "_max_overflow", None),
+        "in_flight_requests": RequestLoggingMiddleware.in_flight,
+    }
+
+
+async def monitor(engine: AsyncEngine) -> None:
+    """Periodically resize the engine's pool; runs until cancelled."""
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return
+    if not overflow_is_resizable():
+        logger.warning(
+            "Connection pool resizing disabled: this SQLAlchemy version does "
+            "not honour QueuePool._max_overflow at checkout"
+        )
+        return
+    
+    while True:
+        await asyncio.sleep(settings.DB_POOL_MONITOR_INTERVAL_SECONDS)
+        try:
+            _resize(pool)
+        except Exception as e:
+            logger.warning(f"Connection pool monitor failed: {e}")
@@ -1,14 +1,15 @@
 """FastAPI dependencies."""
 
-from typing import Annotated, AsyncGenerator, Optional
+from typing import Annotated, AsyncGenerator, Awaitable, Callable, Optional
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import async_session_factory
+from app.core.database import async_session_factory, session_has_writes
 from app.core.security import verify_access_token
+from app.core.user_cache import get_cached_user
 from app.models.user import User, UserRole
 
 
@@ -17,7 +18,9 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_factory() as session:
         try:
             yield session
-            await session.commit()
+            # Read-only requests skip the COMMIT; close() releases the connection
+            if session_has_writes(session):
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -46,10 +49,7 @@ async def get_current_user_optional(
     if user_id is None:
         return None
     
-    from app.repositories.user_repo import UserRepository
-    
-    repo = UserRepository(db)
-    user = await repo.get_by_id(UUID(user_id))
+    user = await get_cached_user(db, UUID(user_id))
     
     if user is None or not user.is_active:
         return None
@@ -73,10 +73,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    from app.repositories.user_repo import UserRepository
-    
-    repo = UserRepository(db)
-    user = await repo.get_by_id(UUID(user_id))
+    user = await get_cached_user(db, UUID(user_id))
     
     if user is None:
         raise HTTPException(
@@ -94,55 +91,53 @@ async def get_current_user(
     return user
 
 
-async def get_current_admin_user(
-    current_user: Annotated[User, Depends(get_current_user)],
-) -> User:
-    """
-    Get the current user if they are an admin or super admin.
-    Raises 403 if user is not an admin.
-    """
-    if current_user.role not in (UserRole.ADMIN, UserRole.SUPER_ADMIN):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin access required",
-        )
-    return current_user
-
-
-async def require_super_admin(
-    current_user: Annotated[User, Depends(get_current_user)],
-) -> User:
-    """
-    Get the current user if they are a super admin (Kyros system admin).
-    Raises 403 if user is not a super admin.
-    """
-    if current_user.role != UserRole.SUPER_ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Super admin access required",
-        )
-    return current_user
+# Type aliases for common dependency patterns
+CurrentUser = Annotated[User, Depends(get_current_user)]
+CurrentUserOptional = Annotated[Optional[User], Depends(get_current_user_optional)]
 
 
-async def get_current_manager_or_admin(
-    current_user: Annotated[User, Depends(get_current_user)],
-) -> User:
+def require_roles(
+    *allowed_roles: UserRole,
+    detail: str = "Insufficient privileges",
+) -> Callable[[User], Awaitable[User]]:
     """
-    Get the current user if they are a manager or admin.
-    Raises 403 if user doesn't have sufficient privileges.
+    Build a dependency that returns the current user if their role is allowed.
+    Raises 403 with the given detail otherwise.
     """
-    if current_user.role not in (UserRole.ADMIN, UserRole.MANAGER, UserRole.SUPER_ADMIN):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Manager or admin access required",
-        )
-    return current_user
-
+    allowed = frozenset(allowed_roles)
+    
+    async def role_checker(current_user: CurrentUser) -> User:
+        if current_user.role not in allowed:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=detail,
+            )
+        return current_user
+    
+    return role_checker
+
+
+# Admin or super admin
+get_current_admin_user = require_roles(
+    UserRole.ADMIN,
+    UserRole.SUPER_ADMIN,
+    detail="Admin access required",
+)
+
+# Super admin only (Kyros system admin)
+require_super_admin = require_roles(
+    UserRole.SUPER_ADMIN,
+    detail="Super admin access required",
+)
+
+# Manager, admin or super admin
+get_current_manager_or_admin = require_roles(
+    UserRole.ADMIN,
+    UserRole.MANAGER,
+    UserRole.SUPER_ADMIN,
+    detail="Manager or admin access required",
+)
 
-# Type aliases for common dependency patterns
-CurrentUser = Annotated[User, Depends(get_current_user)]
-CurrentUserOptional = Annotated[Optional[User], Depends(get_current_user_optional)]
 AdminUser = Annotated[User, Depends(get_current_admin_user)]
 SuperAdminUser = Annotated[User, Depends(require_super_admin)]
 ManagerOrAdmin = Annotated[User, Depends(get_current_manager_or_admin)]
-
@@ -4,20 +4,32 @@ Structured logging configuration for Kyros Backend.
 Provides JSON-formatted logs for production and human-readable logs for development.
 """
 
+import atexit
 import logging
+import queue
 import sys
 from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
+import orjson
+
 from app.core.config import settings
 
+_UTC = timezone.utc
+
+# Attributes every LogRecord has; anything else was passed via ``extra=``
+_RECORD_ATTRS = frozenset(
+    vars(logging.LogRecord("", logging.INFO, "", 0, "", None, None))
+) | {"message", "asctime", "extra"}
+
 
 class JSONFormatter(logging.Formatter):
     """JSON log formatter for structured logging."""
     
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, _UTC),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -30,12 +42,17 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
         
-        # Add extra fields
+        # Add extra fields: logging sets each ``extra=`` key as a record
+        # attribute; an ``extra`` dict attribute is merged as well
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                log_data[key] = value
         if hasattr(record, "extra"):
             log_data.update(record.extra)
         
-        import json
-        return json.dumps(log_data, default=str)
+        return orjson.dumps(
+            log_data, default=str, option=orjson.OPT_UTC_Z
+        ).decode("utf-8")
 
 
 class DevelopmentFormatter(logging.Formatter):
@@ -49,12 +66,20 @@ class DevelopmentFormatter(logging.Formatter):
         "CRITICAL": "\033[35m", # Magenta
     }
     RESET = "\033[0m"
+    DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+    
+    # Color code and padded level name for each level, built once
+    _LEVEL_PREFIXES = {
+        level: (color, f"{level:8}") for level, color in COLORS.items()
+    }
     
     def format(self, record: logging.LogRecord) -> str:
-        color = self.COLORS.get(record.levelname, "")
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        color, level = self._LEVEL_PREFIXES.get(
+            record.levelname, ("", f"{record.levelname:8}")
+        )
+        timestamp = self.formatTime(record, self.DATE_FORMAT)
         
-        message = f"{color}{timestamp} | {record.levelname:8} | {record.name} | {record.getMessage()}{self.RESET}"
+        message = f"{color}{timestamp} | {level} | {record.name} | {record.getMessage()}{self.RESET}"
         
         if record.exc_info:
             message += f"\n{self.formatException(record.exc_info)}"
@@ -62,6 +87,27 @@ class DevelopmentFormatter(logging.Formatter):
         return message
 
 
+class _PassthroughQueueHandler(QueueHandler):
+    """Queue handler that leaves formatting to the listener's handler."""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The default prepare() formats eagerly and drops exc_info, which
+        # would bypass JSONFormatter's exception and extra-field handling.
+        return record
+
+
+_queue_listener: QueueListener | None = None
+
+
+@atexit.register
+def _stop_queue_listener() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
 def setup_logging() -> None:
     """Configure application logging based on environment."""
     
@@ -85,7 +131,14 @@ def setup_logging() -> None:
     else:
         handler.setFormatter(DevelopmentFormatter())
     
-    root_logger.addHandler(handler)
+    # Write to stdout from a background thread so logging never blocks the event loop
+    _stop_queue_listener()
+    global _queue_listener
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _queue_listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _queue_listener.start()
+    
+    root_logger.addHandler(_PassthroughQueueHandler(log_queue))
     
     # Configure third-party loggers
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
@@ -6,14 +6,16 @@ Includes:
 - Request logging
 - Error handling
 - Security headers
+- Health check fast path
 """
 
 import time
 import uuid
-from typing import Callable
+from typing import Any, Callable
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.core.logging import get_logger
 
@@ -36,6 +38,9 @@ class RequestIdMiddleware(BaseHTTPMiddleware):
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """Log request details and timing."""
     
+    # Requests currently being processed (read by the DB pool monitor)
+    in_flight: int = 0
+    
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         start_time = time.perf_counter()
         
@@ -43,7 +48,11 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         request_id = getattr(request.state, "request_id", "unknown")
         
         # Process request
-        response = await call_next(request)
+        RequestLoggingMiddleware.in_flight += 1
+        try:
+            response = await call_next(request)
+        finally:
+            RequestLoggingMiddleware.in_flight -= 1
         
         # Calculate duration
         duration_ms = (time.perf_counter() - start_time) * 1000
@@ -82,3 +91,31 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             del response.headers["server"]
         
         return response
+
+
+class FastPathMiddleware:
+    """
+    Answer fixed GET endpoints (health probes) without routing.
+    
+    Plain ASGI rather than BaseHTTPMiddleware so a probe costs one dict
+    lookup before its response is sent. ``handlers`` maps an exact path to
+    a callable that takes the application and returns the response.
+    """
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        handlers: dict[str, Callable[[Any], Response]],
+    ) -> None:
+        self.app = app
+        self.handlers = handlers
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["method"] == "GET":
+            handler = self.handlers.get(scope["path"])
+            if handler is not None:
+                response = handler(scope["app"])
+                await response(scope, receive, send)
+                return
+        
+        await self.app(scope, receive, send)
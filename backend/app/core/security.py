@@ -1,6 +1,10 @@
 """Security utilities for authentication and authorization."""
 
-from datetime import datetime, timedelta, timezone
+import asyncio
+import secrets
+import string
+import time
+from datetime import timedelta
 from typing import Any, Optional
 from uuid import UUID
 
@@ -9,6 +13,9 @@ import bcrypt
 
 from app.core.config import settings
 
+_CODE_ALPHABET = (string.ascii_uppercase + string.digits).encode("ascii")
+_CODE_BYTE_LIMIT = 256 - 256 % len(_CODE_ALPHABET)
+
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt."""
@@ -26,6 +33,16 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
+async def hash_password_async(password: str) -> str:
+    """Hash a password in a worker thread so bcrypt doesn't block the event loop."""
+    return await asyncio.to_thread(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password in a worker thread so bcrypt doesn't block the event loop."""
+    return await asyncio.to_thread(verify_password, plain_password, hashed_password)
+
+
 def create_access_token(
     subject: str | UUID,
     expires_delta: Optional[timedelta] = None,
@@ -42,17 +59,14 @@ def create_access_token(
     Returns:
         Encoded JWT token string
     """
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+    if not expires_delta:
+        expires_delta = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
+    now = int(time.time())
     to_encode: dict[str, Any] = {
         "sub": str(subject),
-        "exp": expire,
-        "iat": datetime.now(timezone.utc),
+        "exp": now + int(expires_delta.total_seconds()),
+        "iat": now,
         "type": "access",
     }
     
@@ -76,15 +90,14 @@ def create_refresh_token(
     Returns:
         Encoded JWT refresh token string
     """
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(days=7)
+    if not expires_delta:
+        expires_delta = timedelta(days=7)
     
+    now = int(time.time())
     to_encode = {
         "sub": str(subject),
-        "exp": expire,
-        "iat": datetime.now(timezone.utc),
+        "exp": now + int(expires_delta.total_seconds()),
+        "iat": now,
         "type": "refresh",
     }
     
@@ -164,10 +177,9 @@ def create_password_reset_token(email: str) -> str:
     Returns:
         Encoded JWT token for password reset
     """
-    expire = datetime.now(timezone.utc) + timedelta(hours=1)
     to_encode = {
         "sub": email,
-        "exp": expire,
+        "exp": int(time.time()) + 3600,  # 1 hour expiry
         "type": "password_reset",
     }
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
@@ -203,10 +215,9 @@ def create_email_verification_token(email: str) -> str:
     Returns:
         Encoded JWT token for email verification
     """
-    expire = datetime.now(timezone.utc) + timedelta(hours=24)  # 24 hour expiry
     to_encode = {
         "sub": email,
-        "exp": expire,
+        "exp": int(time.time()) + 24 * 3600,  # 24 hour expiry
         "type": "email_verification",
     }
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
@@ -234,11 +245,14 @@ def verify_email_verification_token(token: str) -> Optional[str]:
 
 def generate_company_code() -> str:
     """Generate a unique 9-character company code in XXXX-XXXX format."""
-    import secrets
-    import string
-    
-    chars = string.ascii_uppercase + string.digits
-    # Generate code in XXXX-XXXX format (9 chars total)
-    part1 = "".join(secrets.choice(chars) for _ in range(4))
-    part2 = "".join(secrets.choice(chars) for _ in range(4))
-    return f"{part1}-{part2}"
+    # Draw random bytes in one call and map them onto the alphabet, rejecting
+    # bytes >= 252 (7 * 36) so every character stays uniformly distributed.
+    chars = bytearray()
+    while len(chars) < 8:
+        for byte in secrets.token_bytes(16):
+            if byte < _CODE_BYTE_LIMIT:
+                chars.append(_CODE_ALPHABET[byte % len(_CODE_ALPHABET)])
+                if len(chars) == 8:
+                    break
+    code = chars.decode("ascii")
+    return f"{code[:4]}-{code[4:]}"
@@ -0,0 +1,98 @@
+"""
+Short-lived cache of users for the authentication dependencies.
+
+Every authenticated request resolves the token subject to a ``User``. The
+cache keeps a snapshot of the user's column values for a few seconds so that
+repeated requests from the same user skip the ``SELECT`` on ``users``.
+The TTL is kept short so deactivations and role changes take effect quickly;
+endpoints that change a user should also call ``invalidate_cached_user``,
+which drops the entry again once the change is committed.
+"""
+
+from typing import Any, Optional
+from uuid import UUID
+
+from cachetools import TTLCache
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.models.user import User
+from app.repositories.user_repo import UserRepository
+
+USER_CACHE_TTL_SECONDS = 10
+USER_CACHE_MAX_SIZE = 50_000
+
+# Access happens on the event loop thread with no await between read and
+# write, so the cache needs no extra locking.
+_user_cache: TTLCache[UUID, dict[str, Any]] = TTLCache(
+    maxsize=USER_CACHE_MAX_SIZE,
+    ttl=USER_CACHE_TTL_SECONDS,
+)
+
+_USER_COLUMNS = tuple(attr.key for attr in inspect(User).column_attrs)
+
+# Session.info key holding the ids of users changed in the current transaction
+_STALE_USERS_KEY = "stale_user_ids"
+
+# Bumped whenever committed changes invalidate entries, so a lookup that read
+# the old row before the commit does not cache it afterwards.
+_generation = 0
+
+
+def _snapshot(user: User) -> dict[str, Any]:
+    """Copy the loaded column values of a user."""
+    return {key: getattr(user, key) for key in _USER_COLUMNS}
+
+
+async def get_cached_user(db: AsyncSession, user_id: UUID) -> Optional[User]:
+    """
+    Get a user by ID, serving recent lookups from the cache.
+
+    Cache hits are merged into ``db`` without a load, so the returned
+    instance belongs to the caller's session just like a queried one.
+    """
+    values = _user_cache.get(user_id)
+    if values is not None:
+        user = User(**values)
+        make_transient_to_detached(user)
+        return await db.merge(user, load=False)
+
+    generation = _generation
+    user = await UserRepository(db).get_by_id(user_id)
+    if user is not None and generation == _generation:
+        _user_cache[user_id] = _snapshot(user)
+    return user
+
+
+def invalidate_cached_user(db: AsyncSession, user_id: UUID) -> None:
+    """
+    Drop a user from the cache after it has been modified through ``db``.
+
+    The entry is dropped now and again when ``db`` commits, since a request
+    running in between can still read and cache the old row.
+    """
+    _user_cache.pop(user_id, None)
+    db.info.setdefault(_STALE_USERS_KEY, set()).add(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _drop_committed_users(session: Session) -> None:
+    """Drop users changed in the committed transaction."""
+    global _generation
+    stale = session.info.pop(_STALE_USERS_KEY, None)
+    if stale:
+        _generation += 1
+        for user_id in stale:
+            _user_cache.pop(user_id, None)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_users(session: Session) -> None:
+    """Nothing changed in the database, so there is nothing to drop."""
+    session.info.pop(_STALE_USERS_KEY, None)
+
+
+def clear_user_cache() -> None:
+    """Drop every cached user."""
+    _user_cache.clear()
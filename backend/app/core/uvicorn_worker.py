@@ -0,0 +1,13 @@
+"""Gunicorn worker class for serving the app with uvicorn."""
+
+from uvicorn.workers import UvicornWorker as BaseUvicornWorker
+
+
+class UvicornWorker(BaseUvicornWorker):
+    """Uvicorn worker pinned to uvloop and httptools (both ship with uvicorn[standard])."""
+    
+    CONFIG_KWARGS = {
+        **BaseUvicornWorker.CONFIG_KWARGS,
+        "loop": "uvloop",
+        "http": "httptools",
+    }
@@ -6,7 +6,7 @@ from uuid import UUID
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.season import SeasonStatus
+from app.models.season import Season, SeasonStatus
 from app.models.season_plan import SeasonPlan
 from app.models.workflow import SeasonWorkflow
 from app.repositories.season_repo import SeasonRepository, WorkflowRepository
@@ -25,6 +25,35 @@ class WorkflowGuard:
         SeasonStatus.LOCKED: [],  # No transitions from locked
     }
     
+    # Status each target status must be reached from
+    REQUIRED_PRIOR = {
+        target: prior
+        for prior, targets in WORKFLOW_TRANSITIONS.items()
+        for target in targets
+    }
+    
+    # Workflow flag recording that a status has been reached
+    STEP_FLAGS = {
+        SeasonStatus.LOCATIONS_DEFINED: "locations_defined",
+        SeasonStatus.PLAN_UPLOADED: "plan_uploaded",
+        SeasonStatus.OTB_UPLOADED: "otb_uploaded",
+        SeasonStatus.RANGE_UPLOADED: "range_uploaded",
+        SeasonStatus.LOCKED: "locked",
+    }
+    
+    PREREQUISITE_DETAILS = {
+        SeasonStatus.LOCATIONS_DEFINED: "Locations must be defined before this operation",
+        SeasonStatus.PLAN_UPLOADED: "Season plan must be uploaded before this operation",
+        SeasonStatus.OTB_UPLOADED: "OTB plan must be uploaded before this operation",
+        SeasonStatus.RANGE_UPLOADED: "Range intent must be uploaded before this operation",
+    }
+    
+    IMMUTABLE_DETAILS = {
+        SeasonStatus.PLAN_UPLOADED: "Season plan is immutable - workflow has progressed past plan upload",
+        SeasonStatus.OTB_UPLOADED: "OTB plan is immutable - workflow has progressed past OTB upload",
+        SeasonStatus.RANGE_UPLOADED: "Range intent is immutable - workflow has progressed past range upload",
+    }
+    
     def __init__(self, session: AsyncSession):
         self.session = session
         self.season_repo = SeasonRepository(session)
@@ -34,117 +63,127 @@ class WorkflowGuard:
         """Get workflow for a season."""
         return await self.workflow_repo.get_by_season_id(season_id)
     
-    async def check_season_exists(self, season_id: UUID) -> None:
-        """Check if season exists."""
-        season = await self.season_repo.get_by_id(season_id)
+    async def _get_season_state(
+        self, season_id: UUID
+    ) -> tuple[Season, Optional[SeasonWorkflow]]:
+        """Fetch season and workflow in one query, raising 404 if the season is missing."""
+        season, workflow = await self.season_repo.get_season_and_workflow(season_id)
         if not season:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Season {season_id} not found",
             )
+        return season, workflow
     
-    async def check_not_locked(self, season_id: UUID) -> None:
-        """Check if season is not locked."""
-        season = await self.season_repo.get_by_id(season_id)
-        if season and season.status == SeasonStatus.LOCKED:
+    @staticmethod
+    def _ensure_not_locked(season: Season) -> None:
+        """Raise if the season is locked."""
+        if season.status == SeasonStatus.LOCKED:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Season is locked and cannot be modified",
             )
     
-    async def check_locations_defined(self, season_id: UUID) -> None:
-        """Check if locations are defined for the season."""
-        workflow = await self.get_workflow(season_id)
-        if not workflow or not workflow.locations_defined:
+    @staticmethod
+    def _ensure_step_done(
+        workflow: Optional[SeasonWorkflow], step: str, detail: str
+    ) -> None:
+        """Raise 400 if a prerequisite workflow step is not complete."""
+        if not workflow or not getattr(workflow, step):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Locations must be defined before this operation",
+                detail=detail,
             )
     
-    async def check_plan_uploaded(self, season_id: UUID) -> None:
-        """Check if season plan is uploaded."""
-        workflow = await self.get_workflow(season_id)
-        if not workflow or not workflow.plan_uploaded:
+    @staticmethod
+    def _ensure_step_open(
+        workflow: Optional[SeasonWorkflow], step: str, detail: str
+    ) -> None:
+        """Raise 403 if a workflow step has already been finalized."""
+        if workflow and getattr(workflow, step):
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Season plan must be uploaded before this operation",
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=detail,
             )
     
+    async def check_season_exists(self, season_id: UUID) -> None:
+        """Check if season exists."""
+        await self._get_season_state(season_id)
+    
+    async def check_not_locked(self, season_id: UUID) -> None:
+        """Check if season is not locked."""
+        season = await self.season_repo.get_by_id(season_id)
+        if season:
+            self._ensure_not_locked(season)
+    
+    async def _check_step_completed(self, season_id: UUID, step: SeasonStatus) -> None:
+        """Check that the workflow has reached the given status."""
+        self._ensure_step_done(
+            await self.get_workflow(season_id),
+            self.STEP_FLAGS[step],
+            self.PREREQUISITE_DETAILS[step],
+        )
+    
+    async def check_locations_defined(self, season_id: UUID) -> None:
+        """Check if locations are defined for the season."""
+        await self._check_step_completed(season_id, SeasonStatus.LOCATIONS_DEFINED)
+    
+    async def check_plan_uploaded(self, season_id: UUID) -> None:
+        """Check if season plan is uploaded."""
+        await self._check_step_completed(season_id, SeasonStatus.PLAN_UPLOADED)
+    
     async def check_otb_uploaded(self, season_id: UUID) -> None:
         """Check if OTB is uploaded."""
-        workflow = await self.get_workflow(season_id)
-        if not workflow or not workflow.otb_uploaded:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="OTB plan must be uploaded before this operation",
-            )
+        await self._check_step_completed(season_id, SeasonStatus.OTB_UPLOADED)
     
     async def check_range_uploaded(self, season_id: UUID) -> None:
         """Check if range intent is uploaded."""
-        workflow = await self.get_workflow(season_id)
-        if not workflow or not workflow.range_uploaded:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Range intent must be uploaded before this operation",
-            )
+        await self._check_step_completed(season_id, SeasonStatus.RANGE_UPLOADED)
     
-    async def can_upload_plan(self, season_id: UUID) -> bool:
-        """Check if season plan can be uploaded."""
-        await self.check_season_exists(season_id)
-        await self.check_not_locked(season_id)
-        await self.check_locations_defined(season_id)
+    async def _check_can_transition(self, season_id: UUID, target: SeasonStatus) -> bool:
+        """
+        Check that the season can move to ``target``.
         
-        # Check plan is not already finalized (immutable after complete-plan-upload)
-        workflow = await self.get_workflow(season_id)
-        if workflow and workflow.plan_uploaded:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Season plan is immutable - workflow has progressed past plan upload",
+        The prerequisite step comes from WORKFLOW_TRANSITIONS; the target step
+        must not already be complete (finalized uploads are immutable).
+        """
+        season, workflow = await self._get_season_state(season_id)
+        prior = self.REQUIRED_PRIOR[target]
+        
+        if target != SeasonStatus.LOCKED:
+            self._ensure_not_locked(season)
+        
+        self._ensure_step_done(
+            workflow, self.STEP_FLAGS[prior], self.PREREQUISITE_DETAILS[prior]
+        )
+        
+        if target == SeasonStatus.LOCKED:
+            if workflow and workflow.locked:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Season is already locked",
+                )
+        else:
+            self._ensure_step_open(
+                workflow, self.STEP_FLAGS[target], self.IMMUTABLE_DETAILS[target]
             )
         return True
     
+    async def can_upload_plan(self, season_id: UUID) -> bool:
+        """Check if season plan can be uploaded."""
+        return await self._check_can_transition(season_id, SeasonStatus.PLAN_UPLOADED)
+    
     async def can_upload_otb(self, season_id: UUID) -> bool:
         """Check if OTB can be uploaded."""
-        await self.check_season_exists(season_id)
-        await self.check_not_locked(season_id)
-        await self.check_plan_uploaded(season_id)
-        
-        # Check OTB is not already finalized (immutable after complete-otb-upload)
-        workflow = await self.get_workflow(season_id)
-        if workflow and workflow.otb_uploaded:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="OTB plan is immutable - workflow has progressed past OTB upload",
-            )
-        return True
+        return await self._check_can_transition(season_id, SeasonStatus.OTB_UPLOADED)
     
     async def can_upload_range(self, season_id: UUID) -> bool:
         """Check if range intent can be uploaded."""
-        await self.check_season_exists(season_id)
-        await self.check_not_locked(season_id)
-        await self.check_otb_uploaded(season_id)
-        
-        # Check range is not already finalized (immutable after complete-range-upload)
-        workflow = await self.get_workflow(season_id)
-        if workflow and workflow.range_uploaded:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Range intent is immutable - workflow has progressed past range upload",
-            )
-        return True
+        return await self._check_can_transition(season_id, SeasonStatus.RANGE_UPLOADED)
     
     async def can_lock_season(self, season_id: UUID) -> bool:
         """Check if season can be locked."""
-        await self.check_season_exists(season_id)
-        await self.check_range_uploaded(season_id)
-        
-        workflow = await self.get_workflow(season_id)
-        if workflow and workflow.locked:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Season is already locked",
-            )
-        return True
+        return await self._check_can_transition(season_id, SeasonStatus.LOCKED)
     
     async def can_ingest_po_grn(self, season_id: UUID) -> bool:
         """Check if PO/GRN can be ingested for the season.
@@ -152,8 +191,12 @@ class WorkflowGuard:
         PO/GRN can only be ingested after range intent is uploaded.
         The season must be in RANGE_UPLOADED or LOCKED status.
         """
-        await self.check_season_exists(season_id)
-        await self.check_range_uploaded(season_id)
+        _, workflow = await self._get_season_state(season_id)
+        self._ensure_step_done(
+            workflow,
+            self.STEP_FLAGS[SeasonStatus.RANGE_UPLOADED],
+            self.PREREQUISITE_DETAILS[SeasonStatus.RANGE_UPLOADED],
+        )
         return True
     
     async def check_plan_is_mutable(self, season_id: UUID, plan_id: Optional[UUID] = None, is_approved: bool = False) -> None:
@@ -165,8 +208,8 @@ class WorkflowGuard:
         - Workflow has NOT progressed past plan_uploaded step
         - The individual plan is NOT approved (if plan_id provided)
         """
-        await self.check_season_exists(season_id)
-        await self.check_not_locked(season_id)
+        season, workflow = await self._get_season_state(season_id)
+        self._ensure_not_locked(season)
         
         # Check if individual plan is approved - approved plans are IMMUTABLE
         if is_approved:
@@ -175,12 +218,11 @@ class WorkflowGuard:
                 detail="This plan is approved and cannot be modified. Approved records are immutable.",
             )
         
-        workflow = await self.get_workflow(season_id)
-        if workflow and workflow.plan_uploaded:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Season plan is immutable - workflow has progressed past plan upload. No edits allowed.",
-            )
+        self._ensure_step_open(
+            workflow,
+            self.STEP_FLAGS[SeasonStatus.PLAN_UPLOADED],
+            f"{self.IMMUTABLE_DETAILS[SeasonStatus.PLAN_UPLOADED]}. No edits allowed.",
+        )
     
     async def check_otb_is_mutable(self, season_id: UUID) -> None:
         """
@@ -190,15 +232,13 @@ class WorkflowGuard:
         - Season is not locked
         - Workflow has NOT progressed past otb_uploaded step
         """
-        await self.check_season_exists(season_id)
-        await self.check_not_locked(season_id)
-        
-        workflow = await self.get_workflow(season_id)
-        if workflow and workflow.otb_uploaded:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="OTB plan is immutable - workflow has progressed past OTB upload. No edits allowed.",
-            )
+        season, workflow = await self._get_season_state(season_id)
+        self._ensure_not_locked(season)
+        self._ensure_step_open(
+            workflow,
+            self.STEP_FLAGS[SeasonStatus.OTB_UPLOADED],
+            f"{self.IMMUTABLE_DETAILS[SeasonStatus.OTB_UPLOADED]}. No edits allowed.",
+        )
     
     async def check_range_is_mutable(self, season_id: UUID) -> None:
         """
@@ -208,15 +248,13 @@ class WorkflowGuard:
         - Season is not locked
         - Workflow has NOT progressed past range_uploaded step
         """
-        await self.check_season_exists(season_id)
-        await self.check_not_locked(season_id)
-        
-        workflow = await self.get_workflow(season_id)
-        if workflow and workflow.range_uploaded:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Range intent is immutable - workflow has progressed past range upload. No edits allowed.",
-            )
+        season, workflow = await self._get_season_state(season_id)
+        self._ensure_not_locked(season)
+        self._ensure_step_open(
+            workflow,
+            self.STEP_FLAGS[SeasonStatus.RANGE_UPLOADED],
+            f"{self.IMMUTABLE_DETAILS[SeasonStatus.RANGE_UPLOADED]}. No edits allowed.",
+        )
     
     async def check_po_grn_is_mutable(self, season_id: UUID) -> None:
         """
@@ -225,8 +263,8 @@ class WorkflowGuard:
         PO/GRN is mutable ONLY when:
         - Season is not locked
         """
-        await self.check_season_exists(season_id)
-        await self.check_not_locked(season_id)
+        season, _ = await self._get_season_state(season_id)
+        self._ensure_not_locked(season)
     
     async def update_workflow_step(
         self,
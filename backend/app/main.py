@@ -4,22 +4,30 @@ Kyros Backend Application - FastAPI Entry Point.
 A production-ready FastAPI application for retail planning and procurement management.
 """
 
-import signal
-import sys
-from contextlib import asynccontextmanager
+import asyncio
+import os
+import tempfile
+from contextlib import asynccontextmanager, suppress
+from datetime import datetime, timezone
 from typing import AsyncGenerator
 
-from fastapi import FastAPI, Request, status
+import fasteners
+import orjson
+from fastapi import FastAPI, Request, Response, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.api.v1.router import router as api_v1_router
 from app.core.config import settings
 from app.core.database import engine, is_sqlite
+from app.core.db_pool_monitor import monitor as monitor_db_pool, pool_stats
 from app.core.logging import get_logger, setup_logging
 from app.core.middleware import (
+    FastPathMiddleware,
     RequestIdMiddleware,
     RequestLoggingMiddleware,
     SecurityHeadersMiddleware,
@@ -30,16 +38,75 @@ from app.models.base import Base
 setup_logging()
 logger = get_logger(__name__)
 
+# Derived settings used to configure the app, computed once
+_CORS_ORIGINS = settings.cors_origins_list
+_IS_PROD = settings.is_production
 
-def handle_shutdown_signal(signum, frame):
-    """Handle graceful shutdown signals."""
-    logger.info(f"Received signal {signum}, initiating graceful shutdown...")
-    sys.exit(0)
+# Built once so every ping hits SQLAlchemy's compiled cache and asyncpg's prepared statement
+_PING = text("SELECT 1")
 
 
-# Register signal handlers for graceful shutdown
-signal.signal(signal.SIGTERM, handle_shutdown_signal)
-signal.signal(signal.SIGINT, handle_shutdown_signal)
+async def _open_pinged_connection() -> AsyncConnection:
+    """Check out a connection and round-trip a SELECT 1 on it."""
+    conn = await engine.connect()
+    await conn.execute(_PING)
+    return conn
+
+
+async def _warm_connection_pool() -> None:
+    """Open pool_size connections up front so early requests skip the handshake."""
+    # Hold every connection until all are open so each one is a distinct pool slot
+    connections = await asyncio.gather(
+        *(_open_pinged_connection() for _ in range(engine.pool.size()))
+    )
+    # Closing an AsyncConnection returns it to the pool rather than dropping it
+    await asyncio.gather(*(conn.close() for conn in connections))
+    logger.info(f"Connection pool warmed with {len(connections)} connections")
+
+
+async def _ping_database() -> bool:
+    """Run a lightweight query to check database connectivity."""
+    try:
+        # connect() rather than begin(): no explicit transaction for a read-only ping
+        async with engine.connect() as conn:
+            await conn.execute(_PING)
+        return True
+    except Exception:
+        return False
+
+
+async def _db_health_loop(app: FastAPI) -> None:
+    """Refresh the cached database status used by the health endpoints."""
+    while True:
+        await asyncio.sleep(settings.HEALTH_CHECK_INTERVAL_SECONDS)
+        app.state.db_connected = await _ping_database()
+        app.state.db_checked_at = datetime.now(timezone.utc)
+
+
+_DDL_LOCK_PATH = os.path.join(tempfile.gettempdir(), "kyros_ddl.lock")
+
+
+async def _create_tables() -> bool:
+    """
+    Run create_all in at most one worker at a time.
+    
+    The worker that gets the file lock creates the tables; workers started
+    alongside it wait for the lock and skip DDL. Returns whether DDL ran.
+    """
+    lock = fasteners.InterProcessLock(_DDL_LOCK_PATH)
+    if not lock.acquire(blocking=False):
+        await asyncio.to_thread(lock.acquire)
+        lock.release()
+        return False
+    
+    try:
+        # DDL needs a transaction, and running it also verifies the connection
+        async with engine.begin() as conn:
+            await conn.run_sync(lambda sync_conn: Base.metadata.create_all(sync_conn, checkfirst=True))
+        logger.info("Database tables created/verified")
+    finally:
+        lock.release()
+    return True
 
 
 @asynccontextmanager
@@ -48,30 +115,43 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Application lifespan manager.
     
     Handles startup and shutdown events:
-    - Startup: Create tables (SQLite) or verify database connection (PostgreSQL)
+    - Startup: Create tables (if AUTO_CREATE_TABLES) and verify database connection
     - Shutdown: Dispose database connections
     """
     # Startup
     logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     logger.info(f"Environment: {settings.ENVIRONMENT}")
     
+    # asyncpg needs the asyncio-aware pool; a plain QueuePool blocks the event loop
+    if not is_sqlite and not isinstance(engine.pool, AsyncAdaptedQueuePool):
+        raise RuntimeError(
+            f"Expected AsyncAdaptedQueuePool, got {type(engine.pool).__name__}"
+        )
+    
     app.state.db_connected = False
     try:
-        if is_sqlite:
-            # SQLite: create tables directly (no migrations)
-            async with engine.begin() as conn:
-                await conn.run_sync(lambda sync_conn: Base.metadata.create_all(sync_conn, checkfirst=True))
-            logger.info("Database tables created/verified (SQLite)")
-        
-        # Verify connection
-        async with engine.begin() as conn:
-            await conn.execute(text("SELECT 1"))
+        # Opt-in for dev; otherwise run `python -m app.utils.init_db`
+        # (or Alembic) once before workers start.
+        if not (settings.AUTO_CREATE_TABLES and await _create_tables()):
+            # Verify connection - read-only ping, no explicit transaction
+            async with engine.connect() as conn:
+                await conn.execute(_PING)
         logger.info("Database connection verified")
         app.state.db_connected = True
+        
+        if not is_sqlite:
+            await _warm_connection_pool()
     except Exception as e:
         logger.warning(f"Database connection failed: {e}")
         logger.info("Server starting without database - endpoints requiring DB will fail")
         # Don't raise - allow app to start for API docs viewing
+    app.state.db_checked_at = datetime.now(timezone.utc)
+    
+    # Probe the database in the background so health endpoints don't hit it per request
+    health_task = asyncio.create_task(_db_health_loop(app))
+    background_tasks = [health_task]
+    if not is_sqlite:
+        background_tasks.append(asyncio.create_task(monitor_db_pool(engine)))
     
     logger.info(f"Application started successfully on port 8000")
     
@@ -79,6 +159,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     
     # Shutdown
     logger.info("Shutting down application...")
+    for task in background_tasks:
+        task.cancel()
+    for task in background_tasks:
+        with suppress(asyncio.CancelledError):
+            await task
+    
     try:
         await engine.dispose()
         logger.info("Database connections closed")
@@ -109,12 +195,57 @@ app = FastAPI(
     """,
     version=settings.APP_VERSION,
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
-    docs_url="/docs" if not settings.is_production else None,
-    redoc_url="/redoc" if not settings.is_production else None,
+    docs_url="/docs" if not _IS_PROD else None,
+    redoc_url="/redoc" if not _IS_PROD else None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
-# Add middleware (order matters - first added is last executed)
+
+# Health check responses, shared by the endpoints and the fast-path middleware.
+# The root and health bodies only depend on settings and the DB flag, so they
+# are serialized once.
+_ROOT_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": settings.APP_NAME,
+    "version": "1.0.0",
+})
+_HEALTH_BODIES = {
+    connected: orjson.dumps({
+        "status": "healthy",
+        "database": "connected" if connected else "disconnected",
+    })
+    for connected in (True, False)
+}
+
+
+def _root_response(app: FastAPI) -> Response:
+    return Response(_ROOT_BODY, media_type="application/json")
+
+
+def _health_response(app: FastAPI) -> Response:
+    return Response(
+        _HEALTH_BODIES[bool(app.state.db_connected)],
+        media_type="application/json",
+    )
+
+
+def _ready_status(app: FastAPI) -> dict:
+    state = app.state
+    db_status = "connected" if state.db_connected else "disconnected"
+    
+    response = {
+        "status": "ready" if state.db_connected else "not_ready",
+        "database": db_status,
+        "checked_at": state.db_checked_at,
+    }
+    if not is_sqlite:
+        response["pool"] = pool_stats(engine)
+    return response
+
+
+# Add middleware (order matters - last added is outermost and sees the request first).
+# CORS is added last so preflights are answered before any other middleware runs.
 # Security headers
 app.add_middleware(SecurityHeadersMiddleware)
 
@@ -124,13 +255,24 @@ app.add_middleware(RequestLoggingMiddleware)
 # Request ID tracking
 app.add_middleware(RequestIdMiddleware)
 
+# Health probes skip routing and the middleware above
+app.add_middleware(
+    FastPathMiddleware,
+    handlers={
+        "/": _root_response,
+        "/health": _health_response,
+        "/ready": lambda app: ORJSONResponse(_ready_status(app)),
+    },
+)
+
 # CORS Configuration
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins_list,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=_CORS_ORIGINS,
+    allow_credentials=settings.CORS_ALLOW_CREDENTIALS,
+    allow_methods=settings.CORS_ALLOW_METHODS,
+    allow_headers=settings.CORS_ALLOW_HEADERS,
+    max_age=settings.CORS_MAX_AGE,
 )
 
 
@@ -138,17 +280,19 @@ app.add_middleware(
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle Pydantic validation errors with detailed messages."""
-    errors = []
-    for error in exc.errors():
-        errors.append({
-            "field": ".".join(str(loc) for loc in error["loc"]),
+    join_loc = ".".join
+    errors = [
+        {
+            "field": join_loc(map(str, error["loc"])),
             "message": error["msg"],
             "type": error["type"],
-        })
+        }
+        for error in exc.errors()
+    ]
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "detail": "Validation Error",
@@ -160,12 +304,17 @@ async def validation_exception_handler(
 @app.exception_handler(Exception)
 async def global_exception_handler(
     request: Request, exc: Exception
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle unexpected exceptions."""
-    # Log the error (in production, use proper logging)
-    print(f"Unhandled exception: {exc}")
+    logger.exception(
+        "Unhandled exception",
+        extra={
+            "path": request.url.path,
+            "request_id": getattr(request.state, "request_id", None),
+        },
+    )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "detail": "An unexpected error occurred. Please try again later.",
@@ -177,37 +326,21 @@ async def global_exception_handler(
 app.include_router(api_v1_router, prefix=settings.API_V1_PREFIX)
 
 
-# Health check endpoints
+# Probes are answered by FastPathMiddleware; the routes below document them
+# in OpenAPI and serve any request that reaches the router.
 @app.get("/", tags=["Health"])
-async def root() -> dict:
+async def root(request: Request) -> Response:
     """Root endpoint - API status check."""
-    return {
-        "status": "healthy",
-        "service": settings.APP_NAME,
-        "version": "1.0.0",
-    }
+    return _root_response(request.app)
 
 
 @app.get("/health", tags=["Health"])
-async def health_check() -> dict:
+async def health_check(request: Request) -> Response:
     """Health check endpoint for load balancers and monitoring."""
-    return {
-        "status": "healthy",
-        "database": "connected",
-    }
+    return _health_response(request.app)
 
 
 @app.get("/ready", tags=["Health"])
-async def readiness_check() -> dict:
-    """Readiness check - verify all dependencies are ready."""
-    try:
-        async with engine.begin() as conn:
-            await conn.execute(text("SELECT 1"))
-        db_status = "connected"
-    except Exception:
-        db_status = "disconnected"
-    
-    return {
-        "status": "ready" if db_status == "connected" else "not_ready",
-        "database": db_status,
-    }
+async def readiness_check(request: Request) -> dict:
+    """Readiness check - report the database status from the background probe."""
+    return _ready_status(request.app)
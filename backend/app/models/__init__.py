@@ -1,5 +1,7 @@
 """SQLAlchemy models package."""
 
+from sqlalchemy.orm import configure_mappers
+
 from app.models.base import Base, TimestampMixin, UUIDPrimaryKeyMixin
 from app.models.company import Company, CompanyStatus
 from app.models.user import User, UserRole
@@ -20,6 +22,9 @@ from app.models.otb_position import OTBPosition
 from app.models.otb_adjustment import OTBAdjustment, AdjustmentStatus
 from app.models.range_architecture import RangeArchitecture, RangeStatus
 
+# Resolve relationships once at import (worker boot) rather than on the first query
+configure_mappers()
+
 __all__ = [
     # Base
     "Base",
@@ -5,15 +5,15 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
 
-from sqlalchemy import DateTime, Enum as SQLEnum, ForeignKey, JSON, String, Text, func
+from sqlalchemy import DateTime, Enum as SQLEnum, ForeignKey, Index, JSON, String, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.database import is_sqlite
 from app.models.base import Base, UUIDPrimaryKeyMixin
 
-# Use JSON for SQLite, JSONB for PostgreSQL (better indexing/querying)
-_JSONType = JSON if is_sqlite else JSONB
+# JSONB on PostgreSQL (parsed once on insert, compressed, GIN-indexable);
+# plain JSON elsewhere. Chosen per dialect at compile time.
+_JSONType = JSON().with_variant(JSONB(), "postgresql")
 
 
 class AuditAction(str, Enum):
@@ -40,23 +40,37 @@ class AuditLog(Base, UUIDPrimaryKeyMixin):
     
     __tablename__ = "audit_logs"
     
+    # Audit reads are "history of an entity" or "history of a season", newest
+    # first; two composite indexes serve both without a sort and keep inserts
+    # cheaper than one index per column.
+    __table_args__ = (
+        Index(
+            "ix_audit_entity_time",
+            "entity_type", "entity_id", "timestamp",
+            postgresql_ops={"timestamp": "DESC"},
+        ),
+        Index(
+            "ix_audit_season_time",
+            "season_id", "timestamp",
+            postgresql_ops={"timestamp": "DESC"},
+            postgresql_where=text("season_id IS NOT NULL"),
+        ),
+    )
+    
     # What entity was affected
     entity_type: Mapped[str] = mapped_column(
         String(100),
         nullable=False,
-        index=True,
     )
     entity_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         nullable=False,
-        index=True,
     )
     
     # What action was performed
     action: Mapped[AuditAction] = mapped_column(
         SQLEnum(AuditAction, name="audit_action", create_type=True, values_callable=lambda x: [e.value for e in x]),
         nullable=False,
-        index=True,
     )
     
     # Who performed the action
@@ -72,7 +86,6 @@ class AuditLog(Base, UUIDPrimaryKeyMixin):
         DateTime(timezone=True),
         server_default=func.now(),
         nullable=False,
-        index=True,
     )
     
     # Before and after state (for updates)
@@ -106,7 +119,6 @@ class AuditLog(Base, UUIDPrimaryKeyMixin):
         UUID(as_uuid=True),
         ForeignKey("seasons.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
     )
     
     # Relationships
@@ -8,10 +8,17 @@ from sqlalchemy import DateTime, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+from app.utils.id_generators import uuid7
+
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
     
+    # Fetch server-generated values (created_at, updated_at, computed and
+    # server_default columns) with INSERT/UPDATE ... RETURNING during flush,
+    # so flushed instances never need a refresh() round trip.
+    __mapper_args__ = {"eager_defaults": True}
+    
     type_annotation_map = {
         uuid.UUID: UUID(as_uuid=True),
     }
@@ -28,10 +35,10 @@ class TimestampMixin:
 
 
 class UUIDPrimaryKeyMixin:
-    """Mixin that adds UUID primary key."""
+    """Mixin that adds a time-ordered (v7) UUID primary key."""
     
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
@@ -41,31 +41,44 @@ class Category(Base, UUIDPrimaryKeyMixin, TimestampMixin):
         cascade="all, delete-orphan",
     )
     
-    # Relationships with other models
+    # Relationships with other models. These collections are never read
+    # through a Category, so loading one is an error (use selectinload).
+    # Plans, intents and POs are business data: their FKs cascade in the
+    # database, so deletes stay active here and a category still in use is
+    # refused (see CategoryRepository.is_in_use) rather than emptied.
+    # Positions and range architectures only have their FK set to NULL.
     season_plans: Mapped[list["SeasonPlan"]] = relationship(
         "SeasonPlan",
         back_populates="category",
+        lazy="raise_on_sql",
     )
     otb_plans: Mapped[list["OTBPlan"]] = relationship(
         "OTBPlan",
         back_populates="category",
+        lazy="raise_on_sql",
     )
     range_intents: Mapped[list["RangeIntent"]] = relationship(
         "RangeIntent",
         back_populates="category",
+        lazy="raise_on_sql",
     )
     purchase_orders: Mapped[list["PurchaseOrder"]] = relationship(
         "PurchaseOrder",
         back_populates="category",
+        lazy="raise_on_sql",
     )
     # Phase 2 relationships
     otb_positions: Mapped[list["OTBPosition"]] = relationship(
         "OTBPosition",
         back_populates="category",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     range_architectures: Mapped[list["RangeArchitecture"]] = relationship(
         "RangeArchitecture",
         back_populates="category",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     
     def __repr__(self) -> str:
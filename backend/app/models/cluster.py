@@ -2,7 +2,7 @@
 
 import uuid
 
-from sqlalchemy import Boolean, ForeignKey, String, Text
+from sqlalchemy import Boolean, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -13,6 +13,10 @@ class Cluster(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     """Cluster model representing location groups."""
     
     __tablename__ = "clusters"
+    __table_args__ = (
+        # Company-scoped listing ordered by newest; also serves company_id lookups
+        Index("ix_clusters_company_created", "company_id", "created_at"),
+    )
     
     # Auto-generated unique cluster code (e.g., CLU-A7B3C9D1)
     cluster_code: Mapped[str] = mapped_column(
@@ -27,7 +31,6 @@ class Cluster(Base, UUIDPrimaryKeyMixin, TimestampMixin):
         UUID(as_uuid=True),
         ForeignKey("companies.id", ondelete="CASCADE"),
         nullable=True,
-        index=True,
     )
     
     # Relationships
@@ -35,6 +35,7 @@ class Location(Base, UUIDPrimaryKeyMixin, TimestampMixin):
         UUID(as_uuid=True),
         ForeignKey("clusters.id", ondelete="SET NULL"),
         nullable=True,
+        index=True,
     )
     
     # Multi-tenant isolation
@@ -8,7 +8,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Numeric, String, Text, func
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Numeric, String, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -35,6 +35,10 @@ class OTBAdjustment(Base, UUIDPrimaryKeyMixin):
     """
 
     __tablename__ = "otb_adjustments"
+    __table_args__ = (
+        # Season + status filter ordered by newest (pending approvals queue)
+        Index("ix_otb_adj_season_status_created", "season_id", "status", "created_at"),
+    )
 
     season_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -5,7 +5,7 @@ from datetime import date
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import Date, ForeignKey, Numeric, UniqueConstraint
+from sqlalchemy import Computed, Date, ForeignKey, Index, Numeric, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -25,6 +25,12 @@ class OTBPlan(Base, UUIDPrimaryKeyMixin, TimestampMixin):
             "season_id", "location_id", "category_id", "month",
             name="uq_otb_plan_composite"
         ),
+        # Per-category monthly budget rollups read only the included column
+        Index(
+            "ix_otb_plan_season_cat_month",
+            "season_id", "category_id", "month",
+            postgresql_include=["approved_spend_limit"],
+        ),
     )
     
     season_id: Mapped[uuid.UUID] = mapped_column(
@@ -48,27 +54,31 @@ class OTBPlan(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     planned_sales: Mapped[Decimal] = mapped_column(
         Numeric(precision=18, scale=2),
         nullable=False,
-        default=Decimal("0.00"),
+        server_default=text("0"),
     )
     planned_closing_stock: Mapped[Decimal] = mapped_column(
         Numeric(precision=18, scale=2),
         nullable=False,
-        default=Decimal("0.00"),
+        server_default=text("0"),
     )
     opening_stock: Mapped[Decimal] = mapped_column(
         Numeric(precision=18, scale=2),
         nullable=False,
-        default=Decimal("0.00"),
+        server_default=text("0"),
     )
     on_order: Mapped[Decimal] = mapped_column(
         Numeric(precision=18, scale=2),
         nullable=False,
-        default=Decimal("0.00"),
+        server_default=text("0"),
     )
     
-    # Calculated OTB value (can be stored or computed)
+    # Calculated OTB value, maintained by the database on every insert/update
     approved_spend_limit: Mapped[Decimal] = mapped_column(
         Numeric(precision=18, scale=2),
+        Computed(
+            "planned_sales + planned_closing_stock - opening_stock - on_order",
+            persisted=True,
+        ),
         nullable=False,
     )
     
@@ -78,16 +88,6 @@ class OTBPlan(Base, UUIDPrimaryKeyMixin, TimestampMixin):
         nullable=True,
     )
     
-    @property
-    def calculated_otb(self) -> Decimal:
-        """Calculate OTB: Planned Sales + Planned Closing Stock - Opening Stock - On Order."""
-        return (
-            self.planned_sales 
-            + self.planned_closing_stock 
-            - self.opening_stock 
-            - self.on_order
-        )
-    
     # Relationships
     season: Mapped["Season"] = relationship(
         "Season",
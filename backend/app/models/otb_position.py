@@ -7,7 +7,7 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Date, DateTime, ForeignKey, Numeric, UniqueConstraint, func
+from sqlalchemy import Date, DateTime, ForeignKey, Index, Numeric, UniqueConstraint, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -17,6 +17,10 @@ if TYPE_CHECKING:
     from app.models.category import Category
     from app.models.season import Season
 
+_ZERO = Decimal("0.00")
+_HUNDRED = Decimal(100)
+_LOW_OTB_RATIO = Decimal("0.20")
+
 
 class OTBPosition(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     """Dynamic OTB position tracking.
@@ -33,6 +37,21 @@ class OTBPosition(Base, UUIDPrimaryKeyMixin, TimestampMixin):
             "season_id", "category_id", "month",
             name="uq_otb_position_season_category_month",
         ),
+        # NULLs never collide in the constraint above, so season-level
+        # (uncategorised) rows get their own partial unique index
+        Index(
+            "uq_otb_position_season_month_no_category",
+            "season_id", "month",
+            unique=True,
+            postgresql_where=text("category_id IS NULL"),
+            sqlite_where=text("category_id IS NULL"),
+        ),
+        # Covers the dashboard sums so they can be index-only scans
+        Index(
+            "ix_otb_pos_season_cat_month",
+            "season_id", "category_id", "month",
+            postgresql_include=["planned_otb", "consumed_otb", "available_otb"],
+        ),
     )
 
     season_id: Mapped[uuid.UUID] = mapped_column(
@@ -51,13 +70,13 @@ class OTBPosition(Base, UUIDPrimaryKeyMixin, TimestampMixin):
 
     # OTB components
     planned_otb: Mapped[Decimal] = mapped_column(
-        Numeric(precision=15, scale=2), nullable=False, default=Decimal("0.00"),
+        Numeric(precision=15, scale=2), nullable=False, server_default=text("0"),
     )
     consumed_otb: Mapped[Decimal] = mapped_column(
-        Numeric(precision=15, scale=2), nullable=False, default=Decimal("0.00"),
+        Numeric(precision=15, scale=2), nullable=False, server_default=text("0"),
     )
     available_otb: Mapped[Decimal] = mapped_column(
-        Numeric(precision=15, scale=2), nullable=False, default=Decimal("0.00"),
+        Numeric(precision=15, scale=2), nullable=False, server_default=text("0"),
     )
 
     last_calculated: Mapped[Optional[datetime]] = mapped_column(
@@ -74,15 +93,17 @@ class OTBPosition(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     @property
     def consumption_percentage(self) -> Decimal:
         """Percentage of planned OTB that has been consumed."""
-        if self.planned_otb and self.planned_otb > 0:
-            return round((self.consumed_otb / self.planned_otb) * 100, 2)
-        return Decimal("0.00")
+        planned = self.planned_otb
+        if planned and planned > 0:
+            return round(self.consumed_otb * _HUNDRED / planned, 2)
+        return _ZERO
 
     @property
     def is_low(self) -> bool:
         """True if available OTB is below 20% of planned."""
-        if self.planned_otb and self.planned_otb > 0:
-            return self.available_otb < (self.planned_otb * Decimal("0.20"))
+        planned = self.planned_otb
+        if planned and planned > 0:
+            return self.available_otb < planned * _LOW_OTB_RATIO
         return False
 
     @property
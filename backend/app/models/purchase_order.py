@@ -6,7 +6,7 @@ from datetime import date
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import Date, Enum, ForeignKey, Numeric, String
+from sqlalchemy import Date, Enum, ForeignKey, Index, Numeric, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -36,6 +36,14 @@ class PurchaseOrder(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     """Purchase Order model."""
     
     __tablename__ = "purchase_orders"
+    __table_args__ = (
+        # Season-scoped PO totals by category/location (OTB consumption, analytics)
+        Index(
+            "ix_po_season_cat_loc",
+            "season_id", "category_id", "location_id",
+            postgresql_include=["po_value"],
+        ),
+    )
     
     po_number: Mapped[str] = mapped_column(
         String(100),
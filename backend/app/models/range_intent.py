@@ -5,7 +5,7 @@ from decimal import Decimal
 from typing import Any, Optional
 
 from sqlalchemy import ForeignKey, Numeric, UniqueConstraint, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDPrimaryKeyMixin
@@ -40,8 +40,9 @@ class RangeIntent(Base, UUIDPrimaryKeyMixin, TimestampMixin):
         Numeric(precision=5, scale=2),
         nullable=False,
     )
+    # JSONB on PostgreSQL, plain JSON elsewhere
     price_band_mix: Mapped[dict[str, Any]] = mapped_column(
-        JSON,
+        JSON().with_variant(JSONB(), "postgresql"),
         nullable=False,
         default=dict,
     )
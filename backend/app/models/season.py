@@ -64,47 +64,65 @@ class Season(Base, UUIDPrimaryKeyMixin, TimestampMixin):
         back_populates="created_seasons",
         foreign_keys=[created_by],
     )
+    # Child collections are loaded only on request (selectinload); touching
+    # one lazily is an error rather than a hidden query per season. Deleting
+    # a season leaves the children to the FK ON DELETE CASCADE.
     season_plans: Mapped[list["SeasonPlan"]] = relationship(
         "SeasonPlan",
         back_populates="season",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     otb_plans: Mapped[list["OTBPlan"]] = relationship(
         "OTBPlan",
         back_populates="season",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     range_intents: Mapped[list["RangeIntent"]] = relationship(
         "RangeIntent",
         back_populates="season",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     purchase_orders: Mapped[list["PurchaseOrder"]] = relationship(
         "PurchaseOrder",
         back_populates="season",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     workflow: Mapped["SeasonWorkflow"] = relationship(
         "SeasonWorkflow",
         back_populates="season",
         uselist=False,
         cascade="all, delete-orphan",
+        lazy="selectin",
     )
     # Phase 2 relationships
     otb_positions: Mapped[list["OTBPosition"]] = relationship(
         "OTBPosition",
         back_populates="season",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     otb_adjustments: Mapped[list["OTBAdjustment"]] = relationship(
         "OTBAdjustment",
         back_populates="season",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     range_architectures: Mapped[list["RangeArchitecture"]] = relationship(
         "RangeArchitecture",
         back_populates="season",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     
     def __repr__(self) -> str:
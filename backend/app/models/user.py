@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 
 from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, String, func
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDPrimaryKeyMixin
@@ -35,7 +36,16 @@ class User(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     
     # Role and status
     role: Mapped[UserRole] = mapped_column(
-        Enum(UserRole, name="user_role", create_type=True, values_callable=lambda obj: [e.value for e in obj]),
+        # VARCHAR + CHECK rather than a native PG enum: new roles need no
+        # ALTER TYPE and rows decode without an enum OID lookup.
+        Enum(
+            UserRole,
+            name="user_role_check",
+            native_enum=False,
+            create_constraint=True,
+            length=20,
+            values_callable=lambda obj: [e.value for e in obj],
+        ),
         nullable=False,
         default=UserRole.VIEWER,
     )
@@ -43,8 +53,11 @@ class User(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     is_verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     
     # Organization (multi-tenant) - link to company
-    company_id: Mapped[Optional[str]] = mapped_column(
-        ForeignKey("companies.id", ondelete="SET NULL"), nullable=True
+    company_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("companies.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
     )
     company_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     company_code: Mapped[Optional[str]] = mapped_column(String(50), nullable=True, index=True)
@@ -72,30 +85,43 @@ class User(Base, UUIDPrimaryKeyMixin, TimestampMixin):
         back_populates="users",
         foreign_keys=[company_id],
     )
+    # These collections are never read through a User, so loading one is
+    # an error (use selectinload); on delete the database's ON DELETE rules
+    # handle the rows.
     created_seasons: Mapped[list["Season"]] = relationship(
         "Season",
         back_populates="creator",
         foreign_keys="Season.created_by",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     uploaded_season_plans: Mapped[list["SeasonPlan"]] = relationship(
         "SeasonPlan",
         back_populates="uploader",
         foreign_keys="SeasonPlan.uploaded_by",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     uploaded_otb_plans: Mapped[list["OTBPlan"]] = relationship(
         "OTBPlan",
         back_populates="uploader",
         foreign_keys="OTBPlan.uploaded_by",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     uploaded_range_intents: Mapped[list["RangeIntent"]] = relationship(
         "RangeIntent",
         back_populates="uploader",
         foreign_keys="RangeIntent.uploaded_by",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     audit_logs: Mapped[list["AuditLog"]] = relationship(
         "AuditLog",
         back_populates="user",
         foreign_keys="AuditLog.user_id",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     sessions: Mapped[list["UserSession"]] = relationship(
         "UserSession",
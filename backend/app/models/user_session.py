@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -23,6 +23,15 @@ class UserSession(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     """
     
     __tablename__ = "user_sessions"
+    __table_args__ = (
+        # Live sessions per user; historical rows stay out of the index.
+        # Queries must use the same predicate for the planner to pick it.
+        Index(
+            "ix_user_sessions_active",
+            "user_id",
+            postgresql_where=text("is_active AND revoked_at IS NULL"),
+        ),
+    )
     
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
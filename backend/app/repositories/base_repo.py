@@ -1,19 +1,69 @@
 """Base repository with common CRUD operations."""
 
+from functools import cache
 from typing import Any, Generic, Optional, Type, TypeVar
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import Insert, delete, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
 
 from app.models.base import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
 
 
+@cache
+def _insert_returning(model: Type[Base]) -> Insert:
+    """
+    Build a model's bulk INSERT ... RETURNING construct once.
+
+    Statements are immutable, so the same construct is safe to reuse; its
+    compiled form then stays in the engine's compiled cache under a stable
+    cache key.
+    """
+    return insert(model).returning(model, sort_by_parameter_order=True)
+
+
+@cache
+def _columns(model: Type[Base]) -> dict[str, Any]:
+    """Map a model's column attribute names to their instrumented attributes."""
+    return {attr.key: getattr(model, attr.key) for attr in model.__mapper__.column_attrs}
+
+
+@cache
+def _load_path(model: Type[Base], path: str) -> LoaderOption:
+    """
+    Build an eager-load chain for a dotted relationship path.
+
+    Many-to-one hops are joined into the parent query; collections use
+    ``selectinload`` so parent rows are never multiplied. ``"purchase_order.season"``
+    on GRNRecord becomes
+    ``joinedload(GRNRecord.purchase_order).joinedload(PurchaseOrder.season)``,
+    a single query, while ``"grn_records"`` on PurchaseOrder costs one extra
+    query however many rows it loads.
+    """
+    option = None
+    for name in path.split("."):
+        attr = getattr(model, name)
+        if option is None:
+            option = selectinload(attr) if attr.property.uselist else joinedload(attr)
+        elif attr.property.uselist:
+            option = option.selectinload(attr)
+        else:
+            option = option.joinedload(attr)
+        model = attr.property.mapper.class_
+    return option
+
+
 class BaseRepository(Generic[ModelType]):
     """Base repository with common CRUD operations."""
     
+    # Set on repositories whose models rely on ORM delete cascades that the
+    # database's ON DELETE rules do not reproduce.
+    orm_delete: bool = False
+    
     def __init__(self, model: Type[ModelType], session: AsyncSession):
         self.model = model
         self.session = session
@@ -23,13 +73,18 @@ class BaseRepository(Generic[ModelType]):
         instance = self.model(**kwargs)
         self.session.add(instance)
         await self.session.flush()
-        await self.session.refresh(instance)
         return instance
     
     async def get_by_id(self, id: UUID) -> Optional[ModelType]:
-        """Get a record by ID."""
+        """Get a record by ID, served from the identity map when already loaded."""
+        return await self.session.get(self.model, id)
+    
+    async def get_with(self, id: UUID, *paths: str) -> Optional[ModelType]:
+        """Get a record by ID with the given relationship paths eager-loaded."""
         result = await self.session.execute(
-            select(self.model).where(self.model.id == id)
+            select(self.model)
+            .options(*(_load_path(self.model, path) for path in paths))
+            .where(self.model.id == id)
         )
         return result.scalar_one_or_none()
     
@@ -42,9 +97,10 @@ class BaseRepository(Generic[ModelType]):
         """Get all records with optional filtering and pagination."""
         query = select(self.model)
         
+        columns = _columns(self.model)
         for key, value in filters.items():
-            if value is not None and hasattr(self.model, key):
-                query = query.where(getattr(self.model, key) == value)
+            if value is not None and key in columns:
+                query = query.where(columns[key] == value)
         
         query = query.offset(skip).limit(limit)
         result = await self.session.execute(query)
@@ -54,45 +110,60 @@ class BaseRepository(Generic[ModelType]):
         """Count records with optional filtering."""
         query = select(func.count()).select_from(self.model)
         
+        columns = _columns(self.model)
         for key, value in filters.items():
-            if value is not None and hasattr(self.model, key):
-                query = query.where(getattr(self.model, key) == value)
+            if value is not None and key in columns:
+                query = query.where(columns[key] == value)
         
         result = await self.session.execute(query)
         return result.scalar() or 0
     
     async def update(self, id: UUID, **kwargs: Any) -> Optional[ModelType]:
-        """Update a record by ID."""
-        instance = await self.get_by_id(id)
-        if instance is None:
-            return None
-        
-        for key, value in kwargs.items():
-            if value is not None and hasattr(instance, key):
-                setattr(instance, key, value)
+        """Update a record by ID with a single UPDATE ... RETURNING."""
+        columns = _columns(self.model)
+        values = {
+            key: value
+            for key, value in kwargs.items()
+            if value is not None and key in columns
+        }
+        if not values:
+            return await self.get_by_id(id)
         
-        await self.session.flush()
-        await self.session.refresh(instance)
-        return instance
+        # populate_existing refreshes an already-loaded instance from the
+        # returned row, including onupdate and computed columns.
+        result = await self.session.execute(
+            update(self.model)
+            .where(self.model.id == id)
+            .values(**values)
+            .returning(self.model)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        return result.scalar_one_or_none()
     
     async def delete(self, id: UUID) -> bool:
         """Delete a record by ID."""
-        instance = await self.get_by_id(id)
-        if instance is None:
-            return False
+        if self.orm_delete:
+            instance = await self.get_by_id(id)
+            if instance is None:
+                return False
+            await self.session.delete(instance)
+            await self.session.flush()
+            return True
         
-        await self.session.delete(instance)
-        await self.session.flush()
-        return True
+        result = await self.session.execute(
+            delete(self.model).where(self.model.id == id)
+        )
+        return result.rowcount > 0
     
     async def bulk_create(self, items: list[dict[str, Any]]) -> list[ModelType]:
-        """Bulk create records."""
-        instances = [self.model(**item) for item in items]
-        self.session.add_all(instances)
-        await self.session.flush()
-        for instance in instances:
-            await self.session.refresh(instance)
-        return instances
+        """Bulk create records with one batched INSERT ... RETURNING."""
+        if not items:
+            return []
+        result = await self.session.scalars(
+            _insert_returning(self.model),
+            items,
+        )
+        return list(result.all())
     
     async def get(self, id: UUID) -> Optional[ModelType]:
         """Alias for get_by_id."""
@@ -1,19 +1,27 @@
 """Category repository."""
 
+from collections import defaultdict
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import exists, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.category import Category
+from app.models.otb_plan import OTBPlan
+from app.models.purchase_order import PurchaseOrder
+from app.models.range_intent import RangeIntent
+from app.models.season_plan import SeasonPlan
 from app.repositories.base_repo import BaseRepository
 
 
 class CategoryRepository(BaseRepository[Category]):
     """Repository for Category model operations."""
     
+    # Child categories are deleted by ORM cascade; the FK only sets NULL
+    orm_delete = True
+    
     def __init__(self, session: AsyncSession):
         super().__init__(Category, session)
     
@@ -24,6 +32,25 @@ class CategoryRepository(BaseRepository[Category]):
         )
         return result.scalar_one_or_none()
     
+    async def is_in_use(self, category_id: UUID) -> bool:
+        """Check whether a category or any subcategory has plans, intents or POs."""
+        subtree = (
+            select(Category.id)
+            .where(Category.id == category_id)
+            .cte("subtree", recursive=True)
+        )
+        subtree = subtree.union_all(
+            select(Category.id).where(Category.parent_id == subtree.c.id)
+        )
+        ids = select(subtree.c.id)
+        in_use = or_(
+            *(
+                exists().where(model.category_id.in_(ids))
+                for model in (SeasonPlan, OTBPlan, RangeIntent, PurchaseOrder)
+            )
+        )
+        return bool(await self.session.scalar(select(in_use)))
+    
     async def get_root_categories(
         self,
         skip: int = 0,
@@ -55,28 +82,23 @@ class CategoryRepository(BaseRepository[Category]):
     
     async def get_with_children(self, category_id: UUID) -> Optional[Category]:
         """Get category with its children."""
-        result = await self.session.execute(
-            select(Category)
-            .options(selectinload(Category.children))
-            .where(Category.id == category_id)
-        )
-        return result.scalar_one_or_none()
+        return await self.get_with(category_id, "children")
     
     async def get_tree(self) -> list[Category]:
         """Get full category tree (root categories with all children loaded)."""
-        # Recursive loading - get roots with children
-        result = await self.session.execute(
-            select(Category)
-            .where(Category.parent_id.is_(None))
-            .options(selectinload(Category.children, recursion_depth=5))
-        )
-        return list(result.scalars().all())
+        # One query for every category; the hierarchy is linked in memory so
+        # there is no per-level SELECT and no depth limit.
+        result = await self.session.execute(select(Category))
+        categories = list(result.scalars().all())
+        
+        children_by_parent: defaultdict[Optional[UUID], list[Category]] = defaultdict(list)
+        for category in categories:
+            children_by_parent[category.parent_id].append(category)
+        for category in categories:
+            set_committed_value(category, "children", children_by_parent.get(category.id, []))
+        
+        return children_by_parent[None]
     
     async def get_with_parent(self, category_id: UUID) -> Optional[Category]:
         """Get category with its parent."""
-        result = await self.session.execute(
-            select(Category)
-            .options(selectinload(Category.parent))
-            .where(Category.id == category_id)
-        )
-        return result.scalar_one_or_none()
+        return await self.get_with(category_id, "parent")
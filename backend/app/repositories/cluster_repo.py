@@ -1,10 +1,10 @@
 """Cluster repository."""
 
-import uuid as uuid_module
+import secrets
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -14,20 +14,22 @@ from app.repositories.base_repo import BaseRepository
 
 def generate_cluster_code() -> str:
     """Generate a unique cluster code like CLU-A7B3C9D1."""
-    short_uuid = uuid_module.uuid4().hex[:8].upper()
-    return f"CLU-{short_uuid}"
+    return f"CLU-{secrets.token_hex(4).upper()}"
 
 
 class ClusterRepository(BaseRepository[Cluster]):
     """Repository for Cluster model operations."""
     
+    # Locations are deleted by ORM cascade; the FK only sets NULL
+    orm_delete = True
+    
     def __init__(self, session: AsyncSession):
         super().__init__(Cluster, session)
     
     async def get_by_code(self, cluster_code: str) -> Optional[Cluster]:
         """Get cluster by cluster_code."""
         result = await self.session.execute(
-            select(Cluster).where(Cluster.cluster_code == cluster_code)
+            lambda_stmt(lambda: select(Cluster).where(Cluster.cluster_code == cluster_code))
         )
         return result.scalar_one_or_none()
     
@@ -62,13 +64,13 @@ class ClusterRepository(BaseRepository[Cluster]):
         else:
             # For users without a company, only show clusters without a company
             query = query.where(Cluster.company_id.is_(None))
-        query = query.offset(skip).limit(limit)
+        query = query.order_by(Cluster.created_at.desc()).offset(skip).limit(limit)
         result = await self.session.execute(query)
         return list(result.scalars().all())
     
     async def count_by_company(self, company_id: Optional[UUID]) -> int:
         """Count clusters for a specific company."""
-        query = select(func.count(Cluster.id))
+        query = select(func.count()).select_from(Cluster)
         if company_id:
             query = query.where(Cluster.company_id == company_id)
         else:
@@ -78,12 +80,7 @@ class ClusterRepository(BaseRepository[Cluster]):
     
     async def get_with_locations(self, cluster_id) -> Optional[Cluster]:
         """Get cluster with its locations."""
-        result = await self.session.execute(
-            select(Cluster)
-            .options(selectinload(Cluster.locations))
-            .where(Cluster.id == cluster_id)
-        )
-        return result.scalar_one_or_none()
+        return await self.get_with(cluster_id, "locations")
     
     async def get_all_with_locations(
         self,
@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select, func
+from sqlalchemy import func, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import generate_company_code
@@ -21,7 +21,7 @@ class CompanyRepository(BaseRepository[Company]):
     async def get_by_code(self, code: str) -> Optional[Company]:
         """Get a company by its unique code."""
         result = await self.session.execute(
-            select(Company).where(Company.code == code)
+            lambda_stmt(lambda: select(Company).where(Company.code == code))
         )
         return result.scalar_one_or_none()
     
@@ -39,25 +39,27 @@ class CompanyRepository(BaseRepository[Company]):
         limit: int = 100,
     ) -> tuple[list[Company], int]:
         """List companies by status with pagination."""
-        # Count query
-        count_query = select(func.count()).select_from(Company).where(
-            Company.status == status
-        )
-        total = await self.session.execute(count_query)
-        total_count = total.scalar() or 0
-        
-        # Data query
+        # The total rides along as a window count, so one query returns
+        # both the page and the number of matching rows.
         query = (
-            select(Company)
+            select(Company, func.count().over().label("total"))
             .where(Company.status == status)
             .order_by(Company.created_at.desc())
             .offset(skip)
             .limit(limit)
         )
-        result = await self.session.execute(query)
-        companies = list(result.scalars().all())
+        rows = (await self.session.execute(query)).all()
+        if rows:
+            return [row.Company for row in rows], rows[0].total
         
-        return companies, total_count
+        # A page past the end carries no window count; count separately.
+        if skip == 0:
+            return [], 0
+        count_query = select(func.count()).select_from(Company).where(
+            Company.status == status
+        )
+        total = await self.session.execute(count_query)
+        return [], total.scalar() or 0
     
     async def list_pending(
         self,
@@ -84,10 +86,9 @@ class CompanyRepository(BaseRepository[Company]):
         company.code = generate_company_code()
         company.status = CompanyStatus.APPROVED
         company.approved_at = datetime.now(timezone.utc)
-        company.approved_by = str(approved_by)
+        company.approved_by = approved_by
         
         await self.session.commit()
-        await self.session.refresh(company)
         return company
     
     async def reject(
@@ -108,7 +109,6 @@ class CompanyRepository(BaseRepository[Company]):
         company.rejected_reason = reason
         
         await self.session.commit()
-        await self.session.refresh(company)
         return company
     
     async def suspend(self, company_id: UUID) -> Optional[Company]:
@@ -123,7 +123,6 @@ class CompanyRepository(BaseRepository[Company]):
         company.status = CompanyStatus.SUSPENDED
         
         await self.session.commit()
-        await self.session.refresh(company)
         return company
     
     async def reactivate(self, company_id: UUID) -> Optional[Company]:
@@ -138,5 +137,4 @@ class CompanyRepository(BaseRepository[Company]):
         company.status = CompanyStatus.APPROVED
         
         await self.session.commit()
-        await self.session.refresh(company)
         return company
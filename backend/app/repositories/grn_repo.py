@@ -7,7 +7,6 @@ from uuid import UUID
 
 from sqlalchemy import extract, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.core.database import month_trunc
 
@@ -37,6 +36,39 @@ class GRNRecordRepository(BaseRepository[GRNRecord]):
         )
         return list(result.scalars().all())
     
+    async def get_by_pos(
+        self,
+        po_ids: list[UUID],
+        limit_per_po: Optional[int] = None,
+    ) -> list[GRNRecord]:
+        """
+        Get GRN records for several purchase orders in one query.
+        
+        ``limit_per_po`` keeps only the earliest records of each PO, as
+        ``get_by_po(po_id, 0, limit_per_po)`` would return them.
+        """
+        if not po_ids:
+            return []
+        query = select(GRNRecord).where(GRNRecord.po_id.in_(po_ids))
+        if limit_per_po is not None:
+            ranked = (
+                select(
+                    GRNRecord.id,
+                    func.row_number()
+                    .over(partition_by=GRNRecord.po_id, order_by=GRNRecord.grn_date)
+                    .label("rank"),
+                )
+                .where(GRNRecord.po_id.in_(po_ids))
+                .subquery()
+            )
+            query = (
+                select(GRNRecord)
+                .join(ranked, ranked.c.id == GRNRecord.id)
+                .where(ranked.c.rank <= limit_per_po)
+            )
+        result = await self.session.execute(query.order_by(GRNRecord.grn_date))
+        return list(result.scalars().all())
+    
     async def get_by_date_range(
         self,
         start_date: date,
@@ -67,43 +99,33 @@ class GRNRecordRepository(BaseRepository[GRNRecord]):
     
     async def get_summary(self, po_ids: Optional[list[UUID]] = None) -> dict:
         """Get summary of GRN records."""
+        # One grouped scan; the grand totals are the sum of the month rows.
+        month = month_trunc(GRNRecord.grn_date)
         query = select(
-            func.count(GRNRecord.id).label("total_records"),
-            func.sum(GRNRecord.received_value).label("total_value"),
-        )
+            month.label("month"),
+            func.count().label("records"),
+            func.sum(GRNRecord.received_value).label("value"),
+        ).group_by(month)
         
         if po_ids:
             query = query.where(GRNRecord.po_id.in_(po_ids))
         
         result = await self.session.execute(query)
-        row = result.one()
-        
-        # Get by month breakdown
-        month_query = select(
-            month_trunc(GRNRecord.grn_date).label("month"),
-            func.sum(GRNRecord.received_value).label("value"),
-        ).group_by(month_trunc(GRNRecord.grn_date))
-        
-        if po_ids:
-            month_query = month_query.where(GRNRecord.po_id.in_(po_ids))
-        
-        month_result = await self.session.execute(month_query)
-        by_month = {
-            str(r.month.strftime("%Y-%m") if r.month else "unknown"): r.value or Decimal("0.00")
-            for r in month_result.all()
-        }
+        total_records = 0
+        total_value = Decimal("0.00")
+        by_month = {}
+        for r in result.all():
+            value = r.value or Decimal("0.00")
+            total_records += r.records
+            total_value += value
+            by_month[str(r.month.strftime("%Y-%m") if r.month else "unknown")] = value
         
         return {
-            "total_records": row.total_records or 0,
-            "total_received_value": row.total_value or Decimal("0.00"),
+            "total_records": total_records,
+            "total_received_value": total_value,
             "by_month": by_month,
         }
     
     async def get_with_po(self, grn_id: UUID) -> Optional[GRNRecord]:
         """Get GRN record with purchase order details."""
-        result = await self.session.execute(
-            select(GRNRecord)
-            .options(selectinload(GRNRecord.purchase_order))
-            .where(GRNRecord.id == grn_id)
-        )
-        return result.scalar_one_or_none()
+        return await self.get_with(grn_id, "purchase_order")
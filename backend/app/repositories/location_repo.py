@@ -1,22 +1,108 @@
 """Location repository."""
 
-from typing import Optional
+from typing import Any, Optional
 from uuid import UUID
 
-from sqlalchemy import func, select
+from cachetools import TTLCache
+from sqlalchemy import event, exists, func, inspect, lambda_stmt, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import Session, make_transient_to_detached
 
+from app.models.company import Company
 from app.models.location import Location, LocationType
+from app.models.otb_plan import OTBPlan
+from app.models.purchase_order import PurchaseOrder
+from app.models.season_plan import SeasonPlan
 from app.repositories.base_repo import BaseRepository
 
+LOCATION_CACHE_TTL_SECONDS = 60
+LOCATION_CACHE_MAX_SIZE = 4096
+
+# Column snapshots of locations looked up by (company_id, name). Changed
+# locations are dropped when the session that changed them commits; other
+# workers see changes once the TTL expires. Access never awaits between read
+# and write, so no locking is needed.
+_location_cache: TTLCache[tuple[Optional[UUID], str], dict[str, Any]] = TTLCache(
+    maxsize=LOCATION_CACHE_MAX_SIZE,
+    ttl=LOCATION_CACHE_TTL_SECONDS,
+)
+
+_LOCATION_COLUMNS = tuple(attr.key for attr in inspect(Location).column_attrs)
+
+# Session.info keys for the locations changed in the current transaction, and
+# for a company deletion, whose locations go with it in the database
+_STALE_LOCATIONS_KEY = "stale_location_ids"
+_STALE_ALL_LOCATIONS_KEY = "stale_all_locations"
+
+# Bumped whenever committed changes invalidate entries, so a lookup that read
+# the old row before the commit does not cache it afterwards.
+_generation = 0
+
+
+def _forget(location_id: UUID) -> None:
+    """Drop cached lookups that resolve to the given location."""
+    for key, values in list(_location_cache.items()):
+        if values["id"] == location_id:
+            _location_cache.pop(key, None)
+
+
+def _mark_stale(session: Session, location_id: UUID) -> None:
+    """Drop a location now and again when ``session`` commits."""
+    _forget(location_id)
+    session.info.setdefault(_STALE_LOCATIONS_KEY, set()).add(location_id)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_deleted_locations(session: Session, flush_context: Any) -> None:
+    """Record locations removed by ORM cascades, e.g. from a deleted cluster."""
+    for instance in session.deleted:
+        if isinstance(instance, Location):
+            _mark_stale(session, instance.id)
+        elif isinstance(instance, Company):
+            session.info[_STALE_ALL_LOCATIONS_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _drop_committed_locations(session: Session) -> None:
+    """Drop locations changed in the committed transaction."""
+    global _generation
+    stale = session.info.pop(_STALE_LOCATIONS_KEY, None)
+    if session.info.pop(_STALE_ALL_LOCATIONS_KEY, False):
+        _generation += 1
+        _location_cache.clear()
+    elif stale:
+        _generation += 1
+        for location_id in stale:
+            _forget(location_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_locations(session: Session) -> None:
+    """Nothing changed in the database, so there is nothing to drop."""
+    session.info.pop(_STALE_LOCATIONS_KEY, None)
+    session.info.pop(_STALE_ALL_LOCATIONS_KEY, None)
+
 
 class LocationRepository(BaseRepository[Location]):
     """Repository for Location model operations."""
     
+    # Plans and POs cascade from locations in the database; deleting through
+    # the ORM refuses instead of wiping them (see is_in_use)
+    orm_delete = True
+    
     def __init__(self, session: AsyncSession):
         super().__init__(Location, session)
     
+    async def is_in_use(self, location_id: UUID) -> bool:
+        """Check whether any season plan, OTB plan or PO references a location."""
+        in_use = or_(
+            *(
+                exists().where(model.location_id == location_id)
+                for model in (SeasonPlan, OTBPlan, PurchaseOrder)
+            )
+        )
+        return bool(await self.session.scalar(select(in_use)))
+    
     async def get_by_name(self, name: str) -> Optional[Location]:
         """Get location by name."""
         result = await self.session.execute(
@@ -27,14 +113,43 @@ class LocationRepository(BaseRepository[Location]):
     async def get_by_name_and_company(
         self, name: str, company_id: Optional[UUID]
     ) -> Optional[Location]:
-        """Get location by name within a specific company."""
+        """Get location by name within a specific company.
+
+        Recent lookups are served from a short-lived cache and merged into
+        this session without a query.
+        """
+        key = (company_id, name)
+        values = _location_cache.get(key)
+        if values is not None:
+            location = Location(**values)
+            make_transient_to_detached(location)
+            return await self.session.merge(location, load=False)
+
+        generation = _generation
         query = select(Location).where(Location.name == name)
         if company_id:
             query = query.where(Location.company_id == company_id)
         else:
             query = query.where(Location.company_id.is_(None))
         result = await self.session.execute(query)
-        return result.scalar_one_or_none()
+        location = result.scalar_one_or_none()
+        if location is not None and generation == _generation:
+            _location_cache[key] = {k: getattr(location, k) for k in _LOCATION_COLUMNS}
+        return location
+    
+    async def create(self, **kwargs: Any) -> Location:
+        location = await super().create(**kwargs)
+        _location_cache.pop((location.company_id, location.name), None)
+        return location
+    
+    async def update(self, id: UUID, **kwargs: Any) -> Optional[Location]:
+        _mark_stale(self.session.sync_session, id)
+        return await super().update(id, **kwargs)
+    
+    @classmethod
+    def invalidate(cls) -> None:
+        """Drop every cached location lookup."""
+        _location_cache.clear()
     
     async def get_by_company(
         self,
@@ -45,17 +160,17 @@ class LocationRepository(BaseRepository[Location]):
         limit: int = 100,
     ) -> list[Location]:
         """Get all locations for a specific company with optional filters."""
-        query = select(Location)
+        stmt = lambda_stmt(lambda: select(Location))
         if company_id:
-            query = query.where(Location.company_id == company_id)
+            stmt += lambda s: s.where(Location.company_id == company_id)
         else:
-            query = query.where(Location.company_id.is_(None))
+            stmt += lambda s: s.where(Location.company_id.is_(None))
         if location_type:
-            query = query.where(Location.type == location_type)
+            stmt += lambda s: s.where(Location.type == location_type)
         if cluster_id:
-            query = query.where(Location.cluster_id == cluster_id)
-        query = query.offset(skip).limit(limit)
-        result = await self.session.execute(query)
+            stmt += lambda s: s.where(Location.cluster_id == cluster_id)
+        stmt += lambda s: s.offset(skip).limit(limit)
+        result = await self.session.execute(stmt)
         return list(result.scalars().all())
     
     async def count_by_company(
@@ -117,9 +232,4 @@ class LocationRepository(BaseRepository[Location]):
     
     async def get_with_cluster(self, location_id: UUID) -> Optional[Location]:
         """Get location with cluster details."""
-        result = await self.session.execute(
-            select(Location)
-            .options(selectinload(Location.cluster))
-            .where(Location.id == location_id)
-        )
-        return result.scalar_one_or_none()
+        return await self.get_with(location_id, "cluster")
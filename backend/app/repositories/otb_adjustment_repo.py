@@ -5,7 +5,6 @@ from uuid import UUID
 
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.models.otb_adjustment import AdjustmentStatus, OTBAdjustment
 from app.repositories.base_repo import BaseRepository
@@ -44,18 +43,14 @@ class OTBAdjustmentRepository(BaseRepository[OTBAdjustment]):
         return await self.get_by_season_and_status(season_id, AdjustmentStatus.PENDING)
 
     async def get_with_details(self, adjustment_id: UUID) -> Optional[OTBAdjustment]:
-        result = await self.session.execute(
-            select(OTBAdjustment)
-            .options(
-                selectinload(OTBAdjustment.season),
-                selectinload(OTBAdjustment.from_category),
-                selectinload(OTBAdjustment.to_category),
-                selectinload(OTBAdjustment.approver),
-                selectinload(OTBAdjustment.creator),
-            )
-            .where(OTBAdjustment.id == adjustment_id)
+        return await self.get_with(
+            adjustment_id,
+            "season",
+            "from_category",
+            "to_category",
+            "approver",
+            "creator",
         )
-        return result.scalar_one_or_none()
 
     async def count_by_season(self, season_id: UUID) -> int:
         result = await self.session.execute(
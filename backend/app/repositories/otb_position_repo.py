@@ -5,10 +5,12 @@ from decimal import Decimal
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, lambda_stmt, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from app.core.database import is_sqlite
 from app.models.otb_position import OTBPosition
 from app.repositories.base_repo import BaseRepository
 
@@ -45,15 +47,17 @@ class OTBPositionRepository(BaseRepository[OTBPosition]):
     async def get_by_composite_key(
         self, season_id: UUID, category_id: Optional[UUID], month: date,
     ) -> Optional[OTBPosition]:
-        query = select(OTBPosition).where(
-            OTBPosition.season_id == season_id,
-            OTBPosition.month == month,
+        stmt = lambda_stmt(
+            lambda: select(OTBPosition).where(
+                OTBPosition.season_id == season_id,
+                OTBPosition.month == month,
+            )
         )
         if category_id is not None:
-            query = query.where(OTBPosition.category_id == category_id)
+            stmt += lambda s: s.where(OTBPosition.category_id == category_id)
         else:
-            query = query.where(OTBPosition.category_id.is_(None))
-        result = await self.session.execute(query)
+            stmt += lambda s: s.where(OTBPosition.category_id.is_(None))
+        result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
     async def get_category_summary(self, season_id: UUID) -> list[dict]:
@@ -119,15 +123,7 @@ class OTBPositionRepository(BaseRepository[OTBPosition]):
         }
 
     async def get_with_details(self, position_id: UUID) -> Optional[OTBPosition]:
-        result = await self.session.execute(
-            select(OTBPosition)
-            .options(
-                selectinload(OTBPosition.season),
-                selectinload(OTBPosition.category),
-            )
-            .where(OTBPosition.id == position_id)
-        )
-        return result.scalar_one_or_none()
+        return await self.get_with(position_id, "season", "category")
 
     async def upsert(
         self,
@@ -138,25 +134,36 @@ class OTBPositionRepository(BaseRepository[OTBPosition]):
         consumed_otb: Decimal,
         available_otb: Decimal,
     ) -> OTBPosition:
-        """Create or update an OTB position."""
-        existing = await self.get_by_composite_key(season_id, category_id, month)
-        if existing:
-            existing.planned_otb = planned_otb
-            existing.consumed_otb = consumed_otb
-            existing.available_otb = available_otb
-            from datetime import datetime, timezone
-            existing.last_calculated = datetime.now(timezone.utc)
-            await self.session.flush()
-            await self.session.refresh(existing)
-            return existing
+        """Create or update an OTB position in a single INSERT ... ON CONFLICT."""
+        insert = sqlite_insert if is_sqlite else pg_insert
+        stmt = insert(OTBPosition).values(
+            season_id=season_id,
+            category_id=category_id,
+            month=month.replace(day=1),
+            planned_otb=planned_otb,
+            consumed_otb=consumed_otb,
+            available_otb=available_otb,
+            last_calculated=func.now(),
+        )
+        if category_id is not None:
+            target = {"index_elements": ["season_id", "category_id", "month"]}
         else:
-            from datetime import datetime, timezone
-            return await self.create(
-                season_id=season_id,
-                category_id=category_id,
-                month=month.replace(day=1),
-                planned_otb=planned_otb,
-                consumed_otb=consumed_otb,
-                available_otb=available_otb,
-                last_calculated=datetime.now(timezone.utc),
-            )
+            target = {
+                "index_elements": ["season_id", "month"],
+                "index_where": OTBPosition.category_id.is_(None),
+            }
+        stmt = stmt.on_conflict_do_update(
+            **target,
+            set_={
+                "planned_otb": stmt.excluded.planned_otb,
+                "consumed_otb": stmt.excluded.consumed_otb,
+                "available_otb": stmt.excluded.available_otb,
+                "last_calculated": stmt.excluded.last_calculated,
+                "updated_at": func.now(),
+            },
+        )
+        result = await self.session.execute(
+            stmt.returning(OTBPosition),
+            execution_options={"populate_existing": True},
+        )
+        return result.scalar_one()
@@ -5,9 +5,8 @@ from decimal import Decimal
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.models.otb_plan import OTBPlan
 from app.repositories.base_repo import BaseRepository
@@ -58,12 +57,13 @@ class OTBPlanRepository(BaseRepository[OTBPlan]):
     ) -> Optional[OTBPlan]:
         """Get OTB plan by composite unique key."""
         result = await self.session.execute(
-            select(OTBPlan)
-            .where(
-                OTBPlan.season_id == season_id,
-                OTBPlan.location_id == location_id,
-                OTBPlan.category_id == category_id,
-                OTBPlan.month == month,
+            lambda_stmt(
+                lambda: select(OTBPlan).where(
+                    OTBPlan.season_id == season_id,
+                    OTBPlan.location_id == location_id,
+                    OTBPlan.category_id == category_id,
+                    OTBPlan.month == month,
+                )
             )
         )
         return result.scalar_one_or_none()
@@ -96,13 +96,4 @@ class OTBPlanRepository(BaseRepository[OTBPlan]):
     
     async def get_with_details(self, plan_id: UUID) -> Optional[OTBPlan]:
         """Get OTB plan with related entities."""
-        result = await self.session.execute(
-            select(OTBPlan)
-            .options(
-                selectinload(OTBPlan.season),
-                selectinload(OTBPlan.location),
-                selectinload(OTBPlan.category),
-            )
-            .where(OTBPlan.id == plan_id)
-        )
-        return result.scalar_one_or_none()
+        return await self.get_with(plan_id, "season", "location", "category")
@@ -3,9 +3,8 @@
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.models.season_plan import SeasonPlan
 from app.repositories.base_repo import BaseRepository
@@ -58,14 +57,16 @@ class SeasonPlanRepository(BaseRepository[SeasonPlan]):
     ) -> Optional[SeasonPlan]:
         """Get the latest version of a plan."""
         result = await self.session.execute(
-            select(SeasonPlan)
-            .where(
-                SeasonPlan.season_id == season_id,
-                SeasonPlan.location_id == location_id,
-                SeasonPlan.category_id == category_id,
+            lambda_stmt(
+                lambda: select(SeasonPlan)
+                .where(
+                    SeasonPlan.season_id == season_id,
+                    SeasonPlan.location_id == location_id,
+                    SeasonPlan.category_id == category_id,
+                )
+                .order_by(SeasonPlan.version.desc())
+                .limit(1)
             )
-            .order_by(SeasonPlan.version.desc())
-            .limit(1)
         )
         return result.scalar_one_or_none()
     
@@ -87,6 +88,30 @@ class SeasonPlanRepository(BaseRepository[SeasonPlan]):
         max_version = result.scalar() or 0
         return max_version + 1
     
+    async def get_max_versions(
+        self,
+        season_ids: set[UUID],
+    ) -> dict[tuple[UUID, UUID, UUID], int]:
+        """Get the current max version per (season, location, category)."""
+        result = await self.session.execute(
+            select(
+                SeasonPlan.season_id,
+                SeasonPlan.location_id,
+                SeasonPlan.category_id,
+                func.max(SeasonPlan.version),
+            )
+            .where(SeasonPlan.season_id.in_(season_ids))
+            .group_by(
+                SeasonPlan.season_id,
+                SeasonPlan.location_id,
+                SeasonPlan.category_id,
+            )
+        )
+        return {
+            (season_id, location_id, category_id): max_version
+            for season_id, location_id, category_id, max_version in result.all()
+        }
+    
     async def get_approved_plans(
         self,
         season_id: UUID,
@@ -107,24 +132,18 @@ class SeasonPlanRepository(BaseRepository[SeasonPlan]):
     
     async def approve_plans(self, plan_ids: list[UUID], approved: bool = True) -> int:
         """Approve or reject multiple plans."""
-        count = 0
-        for plan_id in plan_ids:
-            plan = await self.get_by_id(plan_id)
-            if plan:
-                plan.approved = approved
-                count += 1
-        await self.session.flush()
-        return count
+        if not plan_ids:
+            return 0
+        # One UPDATE for the whole batch; "evaluate" keeps plans already
+        # loaded in this session in step without another round trip.
+        result = await self.session.execute(
+            update(SeasonPlan)
+            .where(SeasonPlan.id.in_(plan_ids))
+            .values(approved=approved)
+            .execution_options(synchronize_session="evaluate")
+        )
+        return result.rowcount
     
     async def get_with_details(self, plan_id: UUID) -> Optional[SeasonPlan]:
         """Get plan with related entities."""
-        result = await self.session.execute(
-            select(SeasonPlan)
-            .options(
-                selectinload(SeasonPlan.season),
-                selectinload(SeasonPlan.location),
-                selectinload(SeasonPlan.category),
-            )
-            .where(SeasonPlan.id == plan_id)
-        )
-        return result.scalar_one_or_none()
+        return await self.get_with(plan_id, "season", "location", "category")
@@ -1,10 +1,11 @@
 """Purchase Order repository."""
 
+from collections.abc import AsyncIterator, Sequence
 from decimal import Decimal
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, func, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -12,6 +13,21 @@ from app.models.purchase_order import POSource, PurchaseOrder
 from app.repositories.base_repo import BaseRepository
 
 
+# Plain columns for exports; rows skip ORM hydration and the identity map
+_EXPORT_COLUMNS = (
+    PurchaseOrder.id,
+    PurchaseOrder.po_number,
+    PurchaseOrder.season_id,
+    PurchaseOrder.location_id,
+    PurchaseOrder.category_id,
+    PurchaseOrder.po_value,
+    PurchaseOrder.order_date,
+    PurchaseOrder.supplier_name,
+    PurchaseOrder.status,
+    PurchaseOrder.source,
+)
+
+
 class PurchaseOrderRepository(BaseRepository[PurchaseOrder]):
     """Repository for PurchaseOrder model operations."""
     
@@ -21,10 +37,48 @@ class PurchaseOrderRepository(BaseRepository[PurchaseOrder]):
     async def get_by_po_number(self, po_number: str) -> Optional[PurchaseOrder]:
         """Get purchase order by PO number."""
         result = await self.session.execute(
-            select(PurchaseOrder).where(PurchaseOrder.po_number == po_number)
+            lambda_stmt(lambda: select(PurchaseOrder).where(PurchaseOrder.po_number == po_number))
         )
         return result.scalar_one_or_none()
     
+    async def get_existing_po_numbers(self, po_numbers: set[str]) -> set[str]:
+        """Return which of the given PO numbers already exist."""
+        if not po_numbers:
+            return set()
+        result = await self.session.execute(
+            select(PurchaseOrder.po_number).where(PurchaseOrder.po_number.in_(po_numbers))
+        )
+        return set(result.scalars().all())
+    
+    async def get_existing_ids(self, po_ids: set[UUID]) -> set[UUID]:
+        """Return which of the given PO IDs exist."""
+        if not po_ids:
+            return set()
+        result = await self.session.execute(
+            select(PurchaseOrder.id).where(PurchaseOrder.id.in_(po_ids))
+        )
+        return set(result.scalars().all())
+    
+    async def stream_by_season(
+        self,
+        season_id: UUID,
+        chunk_size: int = 5000,
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Stream a season's purchase orders as column rows, chunk by chunk.
+
+        Uses a server-side cursor, so memory is bounded by ``chunk_size``
+        rather than the number of POs in the season.
+        """
+        result = await self.session.stream(
+            select(*_EXPORT_COLUMNS)
+            .where(PurchaseOrder.season_id == season_id)
+            .order_by(PurchaseOrder.po_number)
+            .execution_options(yield_per=chunk_size)
+        )
+        async for rows in result.partitions():
+            yield rows
+    
     async def get_by_season(
         self,
         season_id: UUID,
@@ -72,48 +126,34 @@ class PurchaseOrderRepository(BaseRepository[PurchaseOrder]):
     
     async def get_summary(self, season_id: Optional[UUID] = None) -> dict:
         """Get summary of purchase orders."""
+        # One grouped scan; the grand totals are the sum of the source rows.
         query = select(
-            func.count(PurchaseOrder.id).label("total_orders"),
-            func.sum(PurchaseOrder.po_value).label("total_value"),
-        )
-        
-        if season_id:
-            query = query.where(PurchaseOrder.season_id == season_id)
-        
-        result = await self.session.execute(query)
-        row = result.one()
-        
-        # Get by source breakdown
-        source_query = select(
             PurchaseOrder.source,
-            func.count(PurchaseOrder.id).label("count"),
+            func.count().label("count"),
+            func.sum(PurchaseOrder.po_value).label("value"),
         ).group_by(PurchaseOrder.source)
         
         if season_id:
-            source_query = source_query.where(PurchaseOrder.season_id == season_id)
+            query = query.where(PurchaseOrder.season_id == season_id)
         
-        source_result = await self.session.execute(source_query)
-        by_source = {str(r.source.value): r.count for r in source_result.all()}
+        result = await self.session.execute(query)
+        total_orders = 0
+        total_value = Decimal("0.00")
+        by_source = {}
+        for r in result.all():
+            total_orders += r.count
+            total_value += r.value or Decimal("0.00")
+            by_source[str(r.source.value)] = r.count
         
         return {
-            "total_orders": row.total_orders or 0,
-            "total_value": row.total_value or Decimal("0.00"),
+            "total_orders": total_orders,
+            "total_value": total_value,
             "by_source": by_source,
         }
     
     async def get_with_details(self, po_id: UUID) -> Optional[PurchaseOrder]:
         """Get purchase order with related entities."""
-        result = await self.session.execute(
-            select(PurchaseOrder)
-            .options(
-                selectinload(PurchaseOrder.season),
-                selectinload(PurchaseOrder.location),
-                selectinload(PurchaseOrder.category),
-                selectinload(PurchaseOrder.grn_records),
-            )
-            .where(PurchaseOrder.id == po_id)
-        )
-        return result.scalar_one_or_none()
+        return await self.get_with(po_id, "season", "location", "category", "grn_records")
     
     async def get_with_grn(
         self,
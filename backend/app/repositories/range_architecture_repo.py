@@ -3,7 +3,7 @@
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -54,18 +54,14 @@ class RangeArchitectureRepository(BaseRepository[RangeArchitecture]):
         return list(result.scalars().all())
 
     async def get_with_details(self, arch_id: UUID) -> Optional[RangeArchitecture]:
-        result = await self.session.execute(
-            select(RangeArchitecture)
-            .options(
-                selectinload(RangeArchitecture.season),
-                selectinload(RangeArchitecture.category),
-                selectinload(RangeArchitecture.submitter),
-                selectinload(RangeArchitecture.reviewer),
-                selectinload(RangeArchitecture.creator),
-            )
-            .where(RangeArchitecture.id == arch_id)
+        return await self.get_with(
+            arch_id,
+            "season",
+            "category",
+            "submitter",
+            "reviewer",
+            "creator",
         )
-        return result.scalar_one_or_none()
 
     async def count_by_season(self, season_id: UUID) -> int:
         result = await self.session.execute(
@@ -88,16 +84,23 @@ class RangeArchitectureRepository(BaseRepository[RangeArchitecture]):
     async def bulk_update_status(
         self, ids: list[UUID], status: RangeStatus, **kwargs,
     ) -> list[RangeArchitecture]:
-        """Update status for multiple range architectures."""
-        updated = []
-        for arch_id in ids:
-            arch = await self.get_by_id(arch_id)
-            if arch:
-                arch.status = status
-                for key, value in kwargs.items():
-                    if hasattr(arch, key) and value is not None:
-                        setattr(arch, key, value)
-                await self.session.flush()
-                await self.session.refresh(arch)
-                updated.append(arch)
-        return updated
+        """Update status for multiple range architectures with one UPDATE ... RETURNING."""
+        if not ids:
+            return []
+        columns = RangeArchitecture.__mapper__.columns
+        values = {
+            key: value
+            for key, value in kwargs.items()
+            if value is not None and key in columns
+        }
+        # populate_existing refreshes instances already in the session from
+        # the returned rows, so no follow-up SELECT or refresh is needed.
+        result = await self.session.execute(
+            update(RangeArchitecture)
+            .where(RangeArchitecture.id.in_(ids))
+            .values(status=status, **values)
+            .returning(RangeArchitecture)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        by_id = {arch.id: arch for arch in result.scalars()}
+        return [by_id[arch_id] for arch_id in ids if arch_id in by_id]
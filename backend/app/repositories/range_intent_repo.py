@@ -5,7 +5,6 @@ from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.models.range_intent import RangeIntent
 from app.repositories.base_repo import BaseRepository
@@ -49,15 +48,7 @@ class RangeIntentRepository(BaseRepository[RangeIntent]):
     
     async def get_with_details(self, intent_id: UUID) -> Optional[RangeIntent]:
         """Get range intent with related entities."""
-        result = await self.session.execute(
-            select(RangeIntent)
-            .options(
-                selectinload(RangeIntent.season),
-                selectinload(RangeIntent.category),
-            )
-            .where(RangeIntent.id == intent_id)
-        )
-        return result.scalar_one_or_none()
+        return await self.get_with(intent_id, "season", "category")
     
     async def upsert(
         self,
@@ -73,7 +64,6 @@ class RangeIntentRepository(BaseRepository[RangeIntent]):
                 if hasattr(existing, key):
                     setattr(existing, key, value)
             await self.session.flush()
-            await self.session.refresh(existing)
             return existing
         
         return await self.create(
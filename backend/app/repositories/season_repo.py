@@ -5,7 +5,8 @@ from uuid import UUID
 
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.season import Season, SeasonStatus
 from app.models.workflow import SeasonWorkflow
@@ -20,12 +21,25 @@ class SeasonRepository(BaseRepository[Season]):
     
     async def get_with_workflow(self, season_id: UUID) -> Optional[Season]:
         """Get season with workflow status."""
+        return await self.get_with(season_id, "workflow")
+    
+    async def get_season_and_workflow(
+        self,
+        season_id: UUID,
+    ) -> tuple[Optional[Season], Optional[SeasonWorkflow]]:
+        """Get season and its workflow row in a single round trip."""
+        # contains_eager fills Season.workflow from the join, so its selectin
+        # loader does not issue a second query
         result = await self.session.execute(
             select(Season)
-            .options(selectinload(Season.workflow))
+            .outerjoin(Season.workflow)
+            .options(contains_eager(Season.workflow))
             .where(Season.id == season_id)
         )
-        return result.scalar_one_or_none()
+        season = result.scalar_one_or_none()
+        if season is None:
+            return None, None
+        return season, season.workflow
     
     async def get_all_with_workflow(
         self,
@@ -114,7 +128,7 @@ class SeasonRepository(BaseRepository[Season]):
         )
         self.session.add(workflow)
         await self.session.flush()
-        await self.session.refresh(season)
+        set_committed_value(season, "workflow", workflow)
         
         return season
     
@@ -154,7 +168,6 @@ class WorkflowRepository(BaseRepository[SeasonWorkflow]):
         if hasattr(workflow, step):
             setattr(workflow, step, value)
             await self.session.flush()
-            await self.session.refresh(workflow)
         
         return workflow
     
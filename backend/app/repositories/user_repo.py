@@ -4,10 +4,10 @@ from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import func, select, update
+from sqlalchemy import func, lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import hash_password, verify_password
+from app.core.security import hash_password_async, verify_password_async
 from app.models.user import User, UserRole
 from app.repositories.base_repo import BaseRepository
 
@@ -24,7 +24,7 @@ class UserRepository(BaseRepository[User]):
         email: str,
         password: str,
         role: UserRole = UserRole.VIEWER,
-        company_id: Optional[str] = None,
+        company_id: Optional[UUID] = None,
         company_name: Optional[str] = None,
         company_code: Optional[str] = None,
         is_active: bool = True,
@@ -33,7 +33,7 @@ class UserRepository(BaseRepository[User]):
         user = User(
             name=name,
             email=email.lower(),
-            password_hash=hash_password(password),
+            password_hash=await hash_password_async(password),
             role=role,
             company_id=company_id,
             company_name=company_name,
@@ -43,16 +43,25 @@ class UserRepository(BaseRepository[User]):
         )
         self.session.add(user)
         await self.session.flush()
-        await self.session.refresh(user)
         return user
     
     async def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email address."""
+        email = email.lower()
         result = await self.session.execute(
-            select(User).where(User.email == email.lower())
+            lambda_stmt(lambda: select(User).where(User.email == email))
         )
         return result.scalar_one_or_none()
     
+    async def get_with_uploads(self, user_id: UUID) -> Optional[User]:
+        """Get user with their uploaded season, OTB and range intent plans."""
+        return await self.get_with(
+            user_id,
+            "uploaded_season_plans",
+            "uploaded_otb_plans",
+            "uploaded_range_intents",
+        )
+    
     async def get_by_name(self, name: str) -> Optional[User]:
         """Get user by name."""
         result = await self.session.execute(
@@ -77,7 +86,7 @@ class UserRepository(BaseRepository[User]):
     
     async def list_by_company(
         self,
-        company_id: str,
+        company_id: UUID,
     ) -> list[User]:
         """Get all users belonging to a company by company_id."""
         result = await self.session.execute(
@@ -130,7 +139,7 @@ class UserRepository(BaseRepository[User]):
         if user is None:
             return None
         
-        if not verify_password(password, user.password_hash):
+        if not await verify_password_async(password, user.password_hash):
             return None
         
         return user
@@ -150,7 +159,7 @@ class UserRepository(BaseRepository[User]):
             update(User)
             .where(User.id == user_id)
             .values(
-                password_hash=hash_password(new_password),
+                password_hash=await hash_password_async(new_password),
                 password_reset_token=None,
                 password_reset_expires=None,
             )
@@ -238,7 +247,7 @@ class UserRepository(BaseRepository[User]):
         # Count query
         count_query = select(func.count()).select_from(User)
         if company_id:
-            count_query = count_query.where(User.company_id == str(company_id))
+            count_query = count_query.where(User.company_id == company_id)
         if role:
             count_query = count_query.where(User.role == role)
         
@@ -248,7 +257,7 @@ class UserRepository(BaseRepository[User]):
         # Data query
         query = select(User).order_by(User.created_at.desc())
         if company_id:
-            query = query.where(User.company_id == str(company_id))
+            query = query.where(User.company_id == company_id)
         if role:
             query = query.where(User.role == role)
         
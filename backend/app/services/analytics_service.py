@@ -6,6 +6,7 @@ from uuid import UUID
 
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from app.core.database import month_trunc
 from app.models.cluster import Cluster
@@ -390,7 +391,17 @@ class AnalyticsService:
         category_id: Optional[UUID] = None,
     ) -> dict:
         """Analyze price band distribution from range intent."""
-        query = select(RangeIntent).where(RangeIntent.season_id == season_id)
+        query = (
+            select(RangeIntent)
+            .options(
+                load_only(
+                    RangeIntent.core_percent,
+                    RangeIntent.fashion_percent,
+                    RangeIntent.price_band_mix,
+                )
+            )
+            .where(RangeIntent.season_id == season_id)
+        )
         
         if category_id:
             query = query.where(RangeIntent.category_id == category_id)
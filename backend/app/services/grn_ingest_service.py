@@ -66,25 +66,22 @@ class GRNIngestService:
         if first_po:
             await self.guard.can_ingest_po_grn(first_po.season_id)
         
-        created_records = []
         errors = []
         
+        # Check PO existence in one query, then insert all valid rows in one batch
+        existing_pos = await self.po_repo.get_existing_ids({r.po_id for r in records})
+        rows = []
         for record_data in records:
-            try:
-                # Verify PO exists
-                po = await self.po_repo.get_by_id(record_data.po_id)
-                if not po:
-                    errors.append(f"PO {record_data.po_id} not found")
-                    continue
-                
-                grn = await self.repo.create(
-                    po_id=record_data.po_id,
-                    grn_date=record_data.grn_date,
-                    received_value=record_data.received_value,
-                )
-                created_records.append(grn)
-            except Exception as e:
-                errors.append(f"Error creating GRN for PO {record_data.po_id}: {str(e)}")
+            if record_data.po_id not in existing_pos:
+                errors.append(f"PO {record_data.po_id} not found")
+                continue
+            rows.append({
+                "po_id": record_data.po_id,
+                "grn_date": record_data.grn_date,
+                "received_value": record_data.received_value,
+            })
+        
+        created_records = await self.repo.bulk_create(rows)
         
         # Audit log the bulk upload
         if created_records and first_po:
@@ -120,6 +117,14 @@ class GRNIngestService:
         total = await self.repo.count(po_id=po_id)
         return records, total
     
+    async def get_grn_records_by_pos(
+        self,
+        po_ids: list[UUID],
+        limit_per_po: Optional[int] = None,
+    ) -> list[GRNRecord]:
+        """Get GRN records for a set of purchase orders, optionally capped per PO."""
+        return await self.repo.get_by_pos(po_ids, limit_per_po)
+    
     async def get_grn_records_by_date_range(
         self,
         start_date: date,
@@ -9,6 +9,7 @@ Implements:
 - Forecasting projections
 """
 
+import asyncio
 from datetime import date, datetime, timezone
 from decimal import Decimal
 from typing import Optional
@@ -18,7 +19,7 @@ from fastapi import HTTPException, status
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import month_trunc
+from app.core.database import month_trunc, run_in_new_session
 from app.models.otb_adjustment import AdjustmentStatus, OTBAdjustment
 from app.models.otb_plan import OTBPlan
 from app.models.otb_position import OTBPosition
@@ -51,6 +52,18 @@ from app.services.audit_service import AuditService
 DEFAULT_LOW_OTB_THRESHOLD = Decimal("20.00")  # 20%
 DEFAULT_UNDERUTILIZED_THRESHOLD = Decimal("50.00")  # 50%
 DEFAULT_IMBALANCE_THRESHOLD = Decimal("25.00")  # 25% variance
+FORECAST_INCREASING_RATIO = Decimal("0.8")  # burn above 80% of plan
+FORECAST_DECREASING_RATIO = Decimal("0.3")  # burn below 30% of plan
+
+_ZERO = Decimal("0.00")
+_HUNDRED = Decimal(100)
+
+
+def _consumption_pct(consumed: Decimal, planned: Decimal) -> Decimal:
+    """Consumed as a percentage of planned, or 0.00 when nothing is planned."""
+    if planned > 0:
+        return round(consumed * _HUNDRED / planned, 2)
+    return _ZERO
 
 
 class OTBCalculationEngine:
@@ -96,12 +109,12 @@ class OTBCalculationEngine:
         for key, planned_otb in planned.items():
             category_id, month = key
             # Apply adjustments
-            adj_in = adjustments.get(("to", category_id), Decimal("0.00"))
-            adj_out = adjustments.get(("from", category_id), Decimal("0.00"))
+            adj_in = adjustments.get(("to", category_id), _ZERO)
+            adj_out = adjustments.get(("from", category_id), _ZERO)
 
             effective_planned = planned_otb + adj_in - adj_out
-            consumed_otb = consumed.get(key, Decimal("0.00"))
-            available_otb = max(effective_planned - consumed_otb, Decimal("0.00"))
+            consumed_otb = consumed.get(key, _ZERO)
+            available_otb = max(effective_planned - consumed_otb, _ZERO)
 
             position = await self.position_repo.upsert(
                 season_id=season_id,
@@ -134,12 +147,12 @@ class OTBCalculationEngine:
         positions = []
         for key, planned_otb in planned.items():
             cat_id, month = key
-            adj_in = adjustments.get(("to", cat_id), Decimal("0.00"))
-            adj_out = adjustments.get(("from", cat_id), Decimal("0.00"))
+            adj_in = adjustments.get(("to", cat_id), _ZERO)
+            adj_out = adjustments.get(("from", cat_id), _ZERO)
 
             effective_planned = planned_otb + adj_in - adj_out
-            consumed_otb = consumed.get(key, Decimal("0.00"))
-            available_otb = max(effective_planned - consumed_otb, Decimal("0.00"))
+            consumed_otb = consumed.get(key, _ZERO)
+            available_otb = max(effective_planned - consumed_otb, _ZERO)
 
             position = await self.position_repo.upsert(
                 season_id=season_id,
@@ -169,11 +182,7 @@ class OTBCalculationEngine:
         total_planned = totals["total_planned"]
         total_consumed = totals["total_consumed"]
         total_available = totals["total_available"]
-        consumption_pct = (
-            round((total_consumed / total_planned) * 100, 2)
-            if total_planned > 0
-            else Decimal("0.00")
-        )
+        consumption_pct = _consumption_pct(total_consumed, total_planned)
 
         # Enrich category summaries with names
         by_category = []
@@ -184,7 +193,7 @@ class OTBCalculationEngine:
                 cat_name = cat.name if cat else None
             tp = cs["total_planned"]
             tc = cs["total_consumed"]
-            pct = round((tc / tp) * 100, 2) if tp > 0 else Decimal("0.00")
+            pct = _consumption_pct(tc, tp)
             by_category.append(OTBCategorySummary(
                 category_id=cs["category_id"],
                 category_name=cat_name,
@@ -199,7 +208,7 @@ class OTBCalculationEngine:
         for ms in month_summary:
             p = ms["planned_otb"]
             c = ms["consumed_otb"]
-            pct = round((c / p) * 100, 2) if p > 0 else Decimal("0.00")
+            pct = _consumption_pct(c, p)
             by_month.append(OTBMonthSummary(
                 month=ms["month"],
                 planned_otb=p,
@@ -235,7 +244,7 @@ class OTBCalculationEngine:
             tp = cs["total_planned"]
             tc = cs["total_consumed"]
             ta = cs["total_available"]
-            pct = round((tc / tp) * 100, 2) if tp > 0 else Decimal("0.00")
+            pct = _consumption_pct(tc, tp)
 
             # Simple projected exhaustion: if consumption rate > 0
             projected_date = None
@@ -285,16 +294,16 @@ class OTBCalculationEngine:
                 projected_consumption = avg_monthly_consumption
                 running_remaining -= projected_consumption
                 trend = "stable"
-                if avg_monthly_consumption > md["planned_otb"] * Decimal("0.8"):
+                if avg_monthly_consumption > md["planned_otb"] * FORECAST_INCREASING_RATIO:
                     trend = "increasing"
-                elif avg_monthly_consumption < md["planned_otb"] * Decimal("0.3"):
+                elif avg_monthly_consumption < md["planned_otb"] * FORECAST_DECREASING_RATIO:
                     trend = "decreasing"
 
                 items.append(OTBForecastResponse(
                     season_id=season_id,
                     month=md["month"],
                     projected_consumption=round(projected_consumption, 2),
-                    projected_remaining=round(max(running_remaining, Decimal("0.00")), 2),
+                    projected_remaining=round(max(running_remaining, _ZERO), 2),
                     trend=trend,
                 ))
 
@@ -312,7 +321,7 @@ class OTBCalculationEngine:
 
         # Compute average planned across categories for imbalance check
         all_planned = [cs["total_planned"] for cs in cat_summary if cs["total_planned"] > 0]
-        avg_planned = sum(all_planned) / len(all_planned) if all_planned else Decimal("0.00")
+        avg_planned = sum(all_planned) / len(all_planned) if all_planned else _ZERO
 
         for cs in cat_summary:
             cat_name = None
@@ -327,7 +336,7 @@ class OTBCalculationEngine:
             if tp <= 0:
                 continue
 
-            pct = round((tc / tp) * 100, 2)
+            pct = _consumption_pct(tc, tp)
 
             # Low OTB: available < 20% of planned
             if ta < tp * (DEFAULT_LOW_OTB_THRESHOLD / 100):
@@ -469,7 +478,6 @@ class OTBCalculationEngine:
         adj.approved_by = approver_id
         adj.approved_at = datetime.now(timezone.utc)
         await self.session.flush()
-        await self.session.refresh(adj)
 
         # Recalculate affected categories
         if adj.from_category_id:
@@ -509,7 +517,6 @@ class OTBCalculationEngine:
         adj.approved_at = datetime.now(timezone.utc)
         adj.rejection_reason = data.rejection_reason
         await self.session.flush()
-        await self.session.refresh(adj)
 
         await self.audit.log(
             entity_type="OTBAdjustment",
@@ -526,8 +533,12 @@ class OTBCalculationEngine:
         self, season_id: UUID, skip: int = 0, limit: int = 100,
     ) -> tuple[list[OTBAdjustment], int]:
         """List adjustments for a season."""
-        items = await self.adjustment_repo.get_by_season(season_id, skip, limit)
-        total = await self.adjustment_repo.count_by_season(season_id)
+        items, total = await asyncio.gather(
+            self.adjustment_repo.get_by_season(season_id, skip, limit),
+            run_in_new_session(
+                lambda s: OTBAdjustmentRepository(s).count_by_season(season_id)
+            ),
+        )
         return items, total
 
     # ─── Internal Helpers ─────────────────────────────────────────────────
@@ -559,7 +570,7 @@ class OTBCalculationEngine:
 
         result = await self.session.execute(query)
         return {
-            (row.category_id, row.month): row.planned_otb or Decimal("0.00")
+            (row.category_id, row.month): row.planned_otb or _ZERO
             for row in result.all()
         }
 
@@ -598,7 +609,7 @@ class OTBCalculationEngine:
             else:
                 month_date = row.month
             if month_date:
-                consumed[(row.category_id, month_date)] = row.consumed or Decimal("0.00")
+                consumed[(row.category_id, month_date)] = row.consumed or _ZERO
         return consumed
 
     async def _get_approved_adjustment_totals(
@@ -624,7 +635,7 @@ class OTBCalculationEngine:
             from_query = from_query.where(OTBAdjustment.from_category_id == category_id)
         result = await self.session.execute(from_query)
         for row in result.all():
-            adjustments[("from", row.from_category_id)] = row.total or Decimal("0.00")
+            adjustments[("from", row.from_category_id)] = row.total or _ZERO
 
         # Incoming adjustments (to)
         to_query = (
@@ -643,6 +654,6 @@ class OTBCalculationEngine:
             to_query = to_query.where(OTBAdjustment.to_category_id == category_id)
         result = await self.session.execute(to_query)
         for row in result.all():
-            adjustments[("to", row.to_category_id)] = row.total or Decimal("0.00")
+            adjustments[("to", row.to_category_id)] = row.total or _ZERO
 
         return adjustments
@@ -4,7 +4,6 @@ OTB Formula: Planned Sales + Planned Closing Stock - Opening Stock - On Order
 """
 
 from datetime import date
-from decimal import Decimal
 from typing import Optional
 from uuid import UUID
 
@@ -28,21 +27,8 @@ class OTBService:
         self.guard = WorkflowGuard(session)
         self.audit = AuditService(session)
     
-    @staticmethod
-    def calculate_otb(
-        planned_sales: Decimal,
-        planned_closing_stock: Decimal,
-        opening_stock: Decimal,
-        on_order: Decimal,
-    ) -> Decimal:
-        """
-        Calculate OTB using the formula:
-        OTB = Planned Sales + Planned Closing Stock - Opening Stock - On Order
-        """
-        return planned_sales + planned_closing_stock - opening_stock - on_order
-    
     async def create_otb_plan(self, data: OTBPlanCreate) -> OTBPlan:
-        """Create a new OTB plan with calculated approved_spend_limit."""
+        """Create a new OTB plan; approved_spend_limit is generated by the database."""
         await self.guard.can_upload_otb(data.season_id)
         
         # Check for duplicate
@@ -58,14 +44,6 @@ class OTBService:
                 detail="OTB plan already exists for this combination",
             )
         
-        # Calculate OTB using formula
-        approved_spend_limit = self.calculate_otb(
-            data.planned_sales,
-            data.planned_closing_stock,
-            data.opening_stock,
-            data.on_order,
-        )
-        
         plan = await self.repo.create(
             season_id=data.season_id,
             location_id=data.location_id,
@@ -75,7 +53,6 @@ class OTBService:
             planned_closing_stock=data.planned_closing_stock,
             opening_stock=data.opening_stock,
             on_order=data.on_order,
-            approved_spend_limit=approved_spend_limit,
             uploaded_by=data.uploaded_by,
         )
         
@@ -93,14 +70,6 @@ class OTBService:
         
         created_plans = []
         for plan_data in plans:
-            # Calculate OTB using formula
-            approved_spend_limit = self.calculate_otb(
-                plan_data.planned_sales,
-                plan_data.planned_closing_stock,
-                plan_data.opening_stock,
-                plan_data.on_order,
-            )
-            
             # Check for duplicate
             existing = await self.repo.get_by_composite_key(
                 plan_data.season_id,
@@ -115,7 +84,6 @@ class OTBService:
                 existing.planned_closing_stock = plan_data.planned_closing_stock
                 existing.opening_stock = plan_data.opening_stock
                 existing.on_order = plan_data.on_order
-                existing.approved_spend_limit = approved_spend_limit
                 created_plans.append(existing)
             else:
                 plan = await self.repo.create(
@@ -127,7 +95,6 @@ class OTBService:
                     planned_closing_stock=plan_data.planned_closing_stock,
                     opening_stock=plan_data.opening_stock,
                     on_order=plan_data.on_order,
-                    approved_spend_limit=approved_spend_limit,
                     uploaded_by=plan_data.uploaded_by,
                 )
                 created_plans.append(plan)
@@ -86,30 +86,30 @@ class SeasonPlanService:
         # Check workflow for first plan's season
         await self.guard.can_upload_plan(plans[0].season_id)
         
-        created_plans = []
+        # One query for current versions; rows repeating a key get successive versions
+        versions = await self.repo.get_max_versions({p.season_id for p in plans})
+        rows = []
         for plan_data in plans:
-            version = await self.repo.get_next_version(
-                plan_data.season_id,
-                plan_data.location_id,
-                plan_data.category_id,
-            )
+            key = (plan_data.season_id, plan_data.location_id, plan_data.category_id)
+            versions[key] = versions.get(key, 0) + 1
             
-            plan = await self.repo.create(
-                season_id=plan_data.season_id,
-                location_id=plan_data.location_id,
-                category_id=plan_data.category_id,
-                sku_id=plan_data.sku_id,
-                planned_sales=plan_data.planned_sales,
-                planned_margin=plan_data.planned_margin,
-                planned_units=plan_data.planned_units,
-                inventory_turns=plan_data.inventory_turns,
-                ly_sales=plan_data.ly_sales,
-                lly_sales=plan_data.lly_sales,
-                version=version,
-                uploaded_by=plan_data.uploaded_by,
-                approved=plan_data.approved,
-            )
-            created_plans.append(plan)
+            rows.append({
+                "season_id": plan_data.season_id,
+                "location_id": plan_data.location_id,
+                "category_id": plan_data.category_id,
+                "sku_id": plan_data.sku_id,
+                "planned_sales": plan_data.planned_sales,
+                "planned_margin": plan_data.planned_margin,
+                "planned_units": plan_data.planned_units,
+                "inventory_turns": plan_data.inventory_turns,
+                "ly_sales": plan_data.ly_sales,
+                "lly_sales": plan_data.lly_sales,
+                "version": versions[key],
+                "uploaded_by": plan_data.uploaded_by,
+                "approved": plan_data.approved,
+            })
+        
+        created_plans = await self.repo.bulk_create(rows)
         
         # Update workflow
         await self.guard.update_workflow_step(
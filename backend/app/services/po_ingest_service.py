@@ -1,5 +1,6 @@
 """Purchase Order ingest service - business logic for PO management."""
 
+import asyncio
 from decimal import Decimal
 from typing import Optional
 from uuid import UUID
@@ -7,6 +8,7 @@ from uuid import UUID
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.database import run_in_new_session
 from app.core.workflow_guard import WorkflowGuard
 from app.models.purchase_order import POSource, POStatus, PurchaseOrder
 from app.repositories.po_repo import PurchaseOrderRepository
@@ -64,31 +66,31 @@ class POIngestService:
         # Check workflow allows PO ingestion for the season
         await self.guard.can_ingest_po_grn(orders[0].season_id)
         
-        created_orders = []
         errors = []
         
+        # Check duplicates against the database (one query) and within the file
+        seen = await self.repo.get_existing_po_numbers({o.po_number for o in orders})
+        rows = []
         for order_data in orders:
-            try:
-                # Check for duplicate
-                existing = await self.repo.get_by_po_number(order_data.po_number)
-                if existing:
-                    errors.append(f"PO {order_data.po_number} already exists")
-                    continue
-                
-                po = await self.repo.create(
-                    po_number=order_data.po_number,
-                    season_id=order_data.season_id,
-                    location_id=order_data.location_id,
-                    category_id=order_data.category_id,
-                    po_value=order_data.po_value,
-                    order_date=order_data.order_date,
-                    supplier_name=order_data.supplier_name,
-                    status=order_data.status or POStatus.DRAFT,
-                    source=POSource.CSV,
-                )
-                created_orders.append(po)
-            except Exception as e:
-                errors.append(f"Error creating PO {order_data.po_number}: {str(e)}")
+            if order_data.po_number in seen:
+                errors.append(f"PO {order_data.po_number} already exists")
+                continue
+            seen.add(order_data.po_number)
+            
+            rows.append({
+                "po_number": order_data.po_number,
+                "season_id": order_data.season_id,
+                "location_id": order_data.location_id,
+                "category_id": order_data.category_id,
+                "po_value": order_data.po_value,
+                "order_date": order_data.order_date,
+                "supplier_name": order_data.supplier_name,
+                "status": order_data.status or POStatus.DRAFT,
+                "source": POSource.CSV,
+            })
+        
+        # Single batched INSERT for all new rows
+        created_orders = await self.repo.bulk_create(rows)
         
         # Audit log the bulk upload
         if created_orders:
@@ -134,16 +136,21 @@ class POIngestService:
         limit: int = 100,
     ) -> tuple[list[PurchaseOrder], int]:
         """Get purchase orders with optional filtering."""
+        # The total runs on its own session so it overlaps with the page query
         if season_id:
-            orders = await self.repo.get_by_season(season_id, skip, limit)
-            total = await self.repo.count(season_id=season_id)
+            page = self.repo.get_by_season(season_id, skip, limit)
+            filters = {"season_id": season_id}
         elif location_id:
-            orders = await self.repo.get_by_location(location_id, skip, limit)
-            total = await self.repo.count(location_id=location_id)
+            page = self.repo.get_by_location(location_id, skip, limit)
+            filters = {"location_id": location_id}
         else:
-            orders = await self.repo.get_all(skip, limit)
-            total = await self.repo.count()
+            page = self.repo.get_all(skip, limit)
+            filters = {}
         
+        orders, total = await asyncio.gather(
+            page,
+            run_in_new_session(lambda s: PurchaseOrderRepository(s).count(**filters)),
+        )
         return orders, total
     
     async def get_summary(
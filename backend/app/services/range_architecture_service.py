@@ -7,6 +7,7 @@ Implements:
 - Business rules enforcement (RNG-001 through RNG-005)
 """
 
+import asyncio
 from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
@@ -14,6 +15,7 @@ from uuid import UUID
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.database import run_in_new_session
 from app.models.category import Category
 from app.models.range_architecture import RangeArchitecture, RangeStatus
 from app.models.season import Season, SeasonStatus
@@ -124,8 +126,12 @@ class RangeArchitectureService:
         self, season_id: UUID, skip: int = 0, limit: int = 100,
     ) -> tuple[list[RangeArchitecture], int]:
         """List range architectures for a season."""
-        items = await self.repo.get_by_season(season_id, skip, limit)
-        total = await self.repo.count_by_season(season_id)
+        items, total = await asyncio.gather(
+            self.repo.get_by_season(season_id, skip, limit),
+            run_in_new_session(
+                lambda s: RangeArchitectureRepository(s).count_by_season(season_id)
+            ),
+        )
         return items, total
 
     async def update(
@@ -155,7 +161,6 @@ class RangeArchitectureService:
             updated.submitted_by = None
             updated.submitted_at = None
             await self.session.flush()
-            await self.session.refresh(updated)
 
         await self.audit.log_update(
             entity_type="RangeArchitecture",
@@ -221,7 +226,6 @@ class RangeArchitectureService:
             arch.submitted_by = user_id
             arch.submitted_at = datetime.now(timezone.utc)
             await self.session.flush()
-            await self.session.refresh(arch)
             submitted.append(arch)
 
         await self.audit.log(
@@ -260,7 +264,6 @@ class RangeArchitectureService:
             arch.reviewed_at = datetime.now(timezone.utc)
             arch.review_comment = data.comment
             await self.session.flush()
-            await self.session.refresh(arch)
             approved.append(arch)
 
         await self.audit.log(
@@ -299,7 +302,6 @@ class RangeArchitectureService:
             arch.reviewed_at = datetime.now(timezone.utc)
             arch.review_comment = data.comment
             await self.session.flush()
-            await self.session.refresh(arch)
             rejected.append(arch)
 
         await self.audit.log(
@@ -164,14 +164,14 @@ class SeasonService:
         
         deleted = await self.repo.delete(season_id)
         
-        # Audit log the deletion
+        # Audit log the deletion. The season row is gone, so the entry cannot
+        # reference it through season_id; entity_id still records which one.
         await self.audit.log_delete(
             entity_type="Season",
             entity_id=season_id,
             user_id=user_id,
             old_data=old_data,
             description=f"Deleted season: {season.name}",
-            season_id=season_id,
         )
         
         return True
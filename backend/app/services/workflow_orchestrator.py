@@ -13,7 +13,6 @@ Manages the complete Kyros workflow:
 """
 
 from datetime import date
-from decimal import Decimal
 from typing import Optional
 from uuid import UUID
 
@@ -243,19 +242,6 @@ class WorkflowOrchestrator:
         await self._verify_season_state(season_id, SeasonStatus.PLAN_UPLOADED)
         return True
     
-    @staticmethod
-    def calculate_otb(
-        planned_sales: Decimal,
-        planned_closing_stock: Decimal,
-        opening_stock: Decimal,
-        on_order: Decimal,
-    ) -> Decimal:
-        """
-        Calculate OTB using the formula:
-        OTB = Planned Sales + Planned Closing Stock - Opening Stock - On Order
-        """
-        return planned_sales + planned_closing_stock - opening_stock - on_order
-    
     async def complete_otb_upload(self, season_id: UUID, user_id: Optional[UUID] = None) -> Season:
         """
         Mark OTB upload as complete and advance workflow.
@@ -1,10 +1,31 @@
 """Custom ID generators for Kyros workflow."""
 
+import os
 import random
 import secrets
 import string
+import time
+import uuid
 from typing import Set
 
+_UUID7_VERSION_BITS = 0x7 << 76
+_UUID7_VARIANT_BITS = 0x2 << 62
+_UUID7_CLEAR_MASK = ~((0xF << 76) | (0x3 << 62))
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (RFC 9562 version 7).
+    
+    The first 48 bits are the Unix time in milliseconds and the rest is
+    random, so rows keyed by these IDs are inserted at the right edge of the
+    primary key index instead of at random pages.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms << 80) | int.from_bytes(os.urandom(10), "big")
+    value = (value & _UUID7_CLEAR_MASK) | _UUID7_VERSION_BITS | _UUID7_VARIANT_BITS
+    return uuid.UUID(int=value)
+
 
 def generate_season_id(existing_ids: Set[str] = None) -> str:
     """
@@ -0,0 +1,25 @@
+"""Create all database tables once, before application workers start."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.core.database import engine
+# Importing from the package registers every model on Base.metadata
+from app.models import Base
+
+
+async def init_db():
+    """Create any missing tables from the model metadata."""
+    
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await engine.dispose()
+    print("✓ Database tables created/verified")
+
+
+if __name__ == "__main__":
+    asyncio.run(init_db())
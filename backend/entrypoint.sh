@@ -28,17 +28,7 @@ asyncio.run(check())
 
 if [ "$FRESH_DB" = "fresh" ]; then
     echo "Fresh database detected. Creating tables from models..."
-    python -c "
-import asyncio
-from app.models.base import Base
-from app.core.database import engine
-
-async def create():
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-asyncio.run(create())
-"
+    python -m app.utils.init_db
     echo "Tables created. Stamping alembic to head..."
     alembic stamp head
 else
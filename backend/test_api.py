@@ -53,16 +53,32 @@ except Exception as e:
 # Test 2: OTB Formula
 print("\n2. Testing OTB Formula...")
 try:
-    from app.services.workflow_orchestrator import WorkflowOrchestrator
+    import uuid
+
+    from sqlalchemy import create_engine, insert, select
+    from app.models.otb_plan import OTBPlan
     
     planned_sales = Decimal("100000.00")
     planned_closing_stock = Decimal("50000.00")
     opening_stock = Decimal("30000.00")
     on_order = Decimal("10000.00")
     
-    otb = WorkflowOrchestrator.calculate_otb(
-        planned_sales, planned_closing_stock, opening_stock, on_order
-    )
+    # approved_spend_limit is a generated column; let the database compute it
+    engine = create_engine("sqlite://")
+    OTBPlan.__table__.create(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(OTBPlan).values(
+            season_id=uuid.uuid4(),
+            location_id=uuid.uuid4(),
+            category_id=uuid.uuid4(),
+            month=date.today().replace(day=1),
+            planned_sales=planned_sales,
+            planned_closing_stock=planned_closing_stock,
+            opening_stock=opening_stock,
+            on_order=on_order,
+        ))
+        otb = conn.execute(select(OTBPlan.approved_spend_limit)).scalar_one()
+    engine.dispose()
     
     expected = planned_sales + planned_closing_stock - opening_stock - on_order
     print(f"   Formula: Planned Sales + Planned Closing Stock - Opening Stock - On Order")